@@ -43,18 +43,19 @@ class AdminPokemonCommands:
         )
         
         # Generation breakdown
-        gen_text = ""
-        for gen in sorted(db_stats['generation_counts'].keys()):
-            count = db_stats['generation_counts'][gen]
-            gen_text += f"**Generation {gen}:** {count} Pokemon\n"
+        gen_text = "".join(
+            f"**Generation {gen}:** {count} Pokemon\n"
+            for gen, count in sorted(db_stats['generation_counts'].items())
+        )
         
         embed.add_field(name="🌍 By Generation", value=gen_text, inline=True)
         
         # Rarity breakdown
-        rarity_text = ""
-        for rarity, count in db_stats['rarity_counts'].items():
-            percentage = (count / db_stats['total_pokemon'] * 100) if db_stats['total_pokemon'] > 0 else 0
-            rarity_text += f"**{rarity}:** {count} ({percentage:.1f}%)\n"
+        total_pokemon = db_stats['total_pokemon']
+        rarity_text = "".join(
+            f"**{rarity}:** {count} ({(count / total_pokemon * 100) if total_pokemon > 0 else 0:.1f}%)\n"
+            for rarity, count in db_stats['rarity_counts'].items()
+        )
         
         embed.add_field(name="⭐ By Rarity", value=rarity_text, inline=True)
         
@@ -143,13 +144,11 @@ class AdminPokemonCommands:
         
         # Show user's current pokeball inventory
         all_balls = player.inventory.get_all_balls()
-        inventory_text = ""
-        for ball_type_key, ball_data in all_balls.items():
-            if ball_data["count"] > 0:
-                inventory_text += f"{ball_data['name']}: {ball_data['count']}\n"
-        
-        if not inventory_text:
-            inventory_text = "No pokeballs"
+        inventory_text = "".join(
+            f"{ball_data['name']}: {ball_data['count']}\n"
+            for ball_data in all_balls.values()
+            if ball_data["count"] > 0
+        ) or "No pokeballs"
         
         embed.add_field(
             name=f"🎒 {user.display_name}'s Pokeball Inventory",
@@ -300,7 +299,8 @@ class AdminPokemonCommands:
                 guild_info += f"\n❌ **`{target_channel}` channel not found**"
                 
                 # Check for similar names
-                similar = [ch.name for ch in guild.text_channels if target_channel.lower() in ch.name.lower()]
+                target_lower = target_channel.lower()
+                similar = [ch.name for ch in guild.text_channels if target_lower in ch.name.lower()]
                 if similar:
                     guild_info += f"\n🔍 **Similar channels:** {', '.join(similar[:3])}"
             
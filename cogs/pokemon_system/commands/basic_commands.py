@@ -4,17 +4,100 @@ Handles core Pokémon gameplay commands like encounters and catching.
 Clean, optimized version with shared logic and no duplication.
 """
 
+import asyncio
+import logging
+import time
 from datetime import datetime
 
 import discord
 
 from config import Config
 from ..managers import PokemonDatabaseManager, PlayerDataManager, WildSpawnManager
-from ..models import CaughtPokemon
+from ..models import PlayerInventory
 from ..utils import PokemonEmbedUtils, PokemonTypeUtils, ValidationUtils, ErrorUtils
 from ..utils.interaction_utils import UnifiedContext, create_unified_context
 from ..utils.mongo_manager import MongoManager
 
+# Catch timestamps only need second resolution, so the formatted string is reused
+# for every catch within the same second
+_last_iso_second = 0
+_last_iso = ""
+
+
+def _now_iso() -> str:
+    """Get the current local time as an ISO string, cached per second"""
+    global _last_iso_second, _last_iso
+    second = int(time.time())
+    if second != _last_iso_second:
+        _last_iso = datetime.fromtimestamp(second).isoformat()
+        _last_iso_second = second
+    return _last_iso
+
+
+# ========== STATIC EMBEDS ==========
+# Error embeds that never change are built once at import and sent as-is;
+# templates with a per-request value are copied before being filled in.
+
+_INVALID_BALL_TYPE_EMBED = ErrorUtils.create_invalid_input_embed("ball type", ValidationUtils.BALL_TYPE_OPTIONS)
+
+_NO_ENCOUNTER_AVAILABLE_EMBED = discord.Embed(
+    title="❌ Error",
+    description="No Pokemon available for encounter. Please try again later.",
+    color=discord.Color.red()
+)
+
+_NO_POKEMON_TO_CATCH_EMBED = discord.Embed(
+    title="❌ No Pokemon to Catch",
+    description="You need to encounter a Pokemon first! Use `!encounter` or `/encounter` to find a wild Pokemon.",
+    color=discord.Color.red()
+)
+
+_ALREADY_ATTEMPTED_EMBED = discord.Embed(
+    title="❌ Already Attempted",
+    description="You have already attempted to catch this Pokemon! Use `!encounter` or `/encounter` to find a new Pokemon.",
+    color=discord.Color.red()
+)
+
+_WILD_ALREADY_ATTEMPTED_EMBED = ErrorUtils.create_already_attempted_embed("catch this wild Pokemon")
+
+_WILD_NOT_AVAILABLE_EMBED = ErrorUtils.create_no_pokemon_embed("catch")
+_WILD_NOT_AVAILABLE_EMBED.description = "There's no wild Pokemon available to catch right now!\nWait for the next wild spawn (every 30 minutes)."
+
+_WILD_NO_POKEBALLS_EMBED = ErrorUtils.create_insufficient_items_embed("Poké Balls")
+_WILD_NO_POKEBALLS_EMBED.description = "You don't have any Poké Balls left! Wild Pokemon can only be caught with Poké Balls."
+
+_NO_WILD_POKEMON_EMBED = discord.Embed(
+    title="❌ No Wild Pokemon",
+    description="There's no wild Pokemon available to catch right now!",
+    color=discord.Color.red()
+)
+
+_CLAIM_FAILED_EMBED = discord.Embed(
+    title="❌ Claim Failed",
+    description="Failed to claim daily bonus. Please try again later.",
+    color=discord.Color.red()
+)
+
+_INVALID_TRADE_USER_EMBED = discord.Embed(
+    title="❌ Invalid User",
+    description="You can't trade check yourself! Please mention another user.",
+    color=discord.Color.red()
+)
+
+_ENCOUNTER_COOLDOWN_TEMPLATE = discord.Embed(title="⏰ Encounter Cooldown", color=discord.Color.orange())
+_CATCH_LIMIT_TEMPLATE = discord.Embed(title="🕒 Catch Limit Reached", color=discord.Color.orange())
+_NO_POKEBALLS_TEMPLATE = discord.Embed(title="❌ No Pokeballs", color=discord.Color.red())
+_DAILY_CLAIMED_TEMPLATE = discord.Embed(title="🕒 Daily Bonus Already Claimed", color=discord.Color.orange())
+_POKEMON_NOT_FOUND_TEMPLATE = discord.Embed(title="❌ Pokémon Not Found", color=discord.Color.red())
+
+# Field layout of the wild catch success embed; values are filled per catch
+_WILD_CATCH_SUCCESS_FIELDS = (
+    {"name": "Type", "value": "", "inline": True},
+    {"name": "Rarity", "value": "", "inline": True},
+    {"name": "Collection ID", "value": "", "inline": True},
+    {"name": "🏆 Victory!", "value": "", "inline": False},
+)
+
 
 class BasicPokemonCommands:
     """Contains basic Pokémon gameplay commands with shared logic architecture"""
@@ -25,51 +108,85 @@ class BasicPokemonCommands:
         self.wild_spawn = wild_spawn
         self.mongo_db = mongo_db
         
+        # Display names for every accepted ball type, including legacy aliases
+        self._ball_display_names = {
+            ball_type: PlayerInventory.get_ball_info(ball_type).get("name", ball_type.title() + " Balls")
+            for ball_type in ValidationUtils.VALID_BALL_TYPES
+        }
+        
         # Setup logging
         self.logger = Config.setup_logging()
     
+    def _build_pokemon_doc(self, pokemon, user_id: str, ball_type: str, source: str, pokemon_id: int) -> dict:
+        """Build the flattened MongoDB document for a newly caught Pokémon"""
+        if hasattr(pokemon, "to_dict"):
+            pokemon_dict = pokemon.to_dict()
+        else:
+            pokemon_dict = dict(pokemon.__dict__)
+        
+        # catch_rate is not needed in storage
+        pokemon_dict.pop("catch_rate", None)
+        pokemon_dict.update(
+            id=pokemon_id,
+            owner_id=user_id,
+            caught_date=_now_iso(),
+            caught_with=ball_type,
+            caught_from=source
+        )
+        return pokemon_dict
+    
     def _log_catch_attempt(self, user, catch_details):
         """Log detailed catch attempt information"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         details = catch_details
         # Sanitize display name to ASCII-only characters to avoid encoding issues
-        safe_display_name = user.display_name.encode('ascii', 'replace').decode('ascii')
+        display_name = user.display_name
+        if display_name.isascii():
+            safe_display_name = display_name
+        else:
+            safe_display_name = display_name.encode('ascii', 'replace').decode('ascii')
         user_info = f"{safe_display_name} ({user.id})"
         
-        # Log basic catch attempt
-        self.logger.info(f"CATCH ATTEMPT - User: {user_info}")
-        self.logger.info(f"  Pokemon: {details['pokemon_name']}")
-        self.logger.info(f"  Ball Used: {details['ball_name']} ({details['ball_type']})")
-        self.logger.info(f"  Original Catch Rate: {details['original_catch_rate']:.1%}")
+        # Basic catch attempt
+        lines = [
+            f"CATCH ATTEMPT - User: {user_info}",
+            f"  Pokemon: {details['pokemon_name']}",
+            f"  Ball Used: {details['ball_name']} ({details['ball_type']})",
+            f"  Original Catch Rate: {details['original_catch_rate']:.1%}",
+        ]
         
-        # Log ball effect
+        # Ball effect
         if details['ball_modifier'] == float('inf'):
-            self.logger.info(f"  Ball Effect: Master Ball (Guaranteed Capture)")
-            self.logger.info(f"  Final Catch Rate: 100.0%")
+            lines.append("  Ball Effect: Master Ball (Guaranteed Capture)")
+            lines.append("  Final Catch Rate: 100.0%")
         else:
-            self.logger.info(f"  Ball Modifier: {details['ball_modifier']}x")
-            self.logger.info(f"  Final Catch Rate: {details['final_catch_rate']:.1%}")
+            lines.append(f"  Ball Modifier: {details['ball_modifier']}x")
+            lines.append(f"  Final Catch Rate: {details['final_catch_rate']:.1%}")
         
-        # Log outcome
-        self.logger.info(f"  Random Roll: {details['random_roll']:.3f}")
+        # Outcome
+        lines.append(f"  Random Roll: {details['random_roll']:.3f}")
         
         if details['success']:
-            self.logger.info(f"  RESULT: [SUCCESS] CAUGHT! ({details['random_roll']:.3f} <= {details['final_catch_rate']:.3f})")
+            lines.append(f"  RESULT: [SUCCESS] CAUGHT! ({details['random_roll']:.3f} <= {details['final_catch_rate']:.3f})")
         else:
-            self.logger.info(f"  RESULT: [FAILED] ESCAPED ({details['random_roll']:.3f} > {details['final_catch_rate']:.3f})")
+            lines.append(f"  RESULT: [FAILED] ESCAPED ({details['random_roll']:.3f} > {details['final_catch_rate']:.3f})")
         
-        # Log performance comparison
+        # Performance comparison
         original_success = details['random_roll'] <= details['original_catch_rate']
         if details['ball_modifier'] != 1.0 and details['ball_modifier'] != float('inf'):
             if details['success'] and not original_success:
-                self.logger.info(f"  BALL IMPACT: [HELPFUL] Ball helped secure the catch!")
+                lines.append("  BALL IMPACT: [HELPFUL] Ball helped secure the catch!")
             elif not details['success'] and original_success:
-                self.logger.info(f"  BALL IMPACT: [NOTE] Would have caught with Poke Ball") 
+                lines.append("  BALL IMPACT: [NOTE] Would have caught with Poke Ball")
             elif details['success'] and original_success:
-                self.logger.info(f"  BALL IMPACT: [BONUS] Would have caught anyway, but ball improved odds")
+                lines.append("  BALL IMPACT: [BONUS] Would have caught anyway, but ball improved odds")
             else:
-                self.logger.info(f"  BALL IMPACT: [INSUFFICIENT] Ball wasn't enough to secure catch")
+                lines.append("  BALL IMPACT: [INSUFFICIENT] Ball wasn't enough to secure catch")
         
-        self.logger.info("---")
+        lines.append("---")
+        self.logger.info("\n".join(lines))
     
     # ========== SHARED LOGIC FUNCTIONS ==========
     
@@ -78,30 +195,23 @@ class BasicPokemonCommands:
         Shared logic for both prefix and slash encounter commands
         Returns True if successful, False if failed
         """
-        user_id = str(unified_ctx.author.id)
+        author = unified_ctx.author
+        user_id = str(author.id)
         player = self.player_db.get_player(user_id)
         
         # Check cooldown
         if not player.can_encounter():
             cooldown_remaining = player.get_cooldown_remaining_formatted()
             if cooldown_remaining:  # Only show cooldown if there's actually time remaining
-                embed = discord.Embed(
-                    title="⏰ Encounter Cooldown",
-                    description=f"You need to wait **{cooldown_remaining}** before encountering another Pokemon!",
-                    color=discord.Color.orange()
-                )
+                embed = _ENCOUNTER_COOLDOWN_TEMPLATE.copy()
+                embed.description = f"You need to wait **{cooldown_remaining}** before encountering another Pokemon!"
                 await unified_ctx.send_error(embed)
                 return False
         
         # Get random Pokemon
         pokemon = self.pokemon_db.get_random_pokemon_by_rarity_weights()
         if not pokemon:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="No Pokemon available for encounter. Please try again later.",
-                color=discord.Color.red()
-            )
-            await unified_ctx.send_error(embed)
+            await unified_ctx.send_error(_NO_ENCOUNTER_AVAILABLE_EMBED)
             return False
         
         # Update player with encounter
@@ -109,12 +219,13 @@ class BasicPokemonCommands:
         self.player_db.save_player(user_id)
         
         # Check if player already owns this Pokemon
-        already_owned = self.mongo_db.has_pokemon_by_name(user_id, pokemon.name)
+        owned_counts = await self.player_db.get_owned_counts(user_id)
+        already_owned = owned_counts[pokemon.name] > 0
         
         # Create and send embed
         embed = PokemonEmbedUtils.create_encounter_embed(
             pokemon=pokemon,
-            user=unified_ctx.author,
+            user=author,
             already_owned=already_owned
         )
         
@@ -126,105 +237,70 @@ class BasicPokemonCommands:
         Shared logic for both prefix and slash catch commands
         Returns True if successful, False if failed
         """
-        user_id = str(unified_ctx.author.id)
+        author = unified_ctx.author
+        user_id = str(author.id)
         player = self.player_db.get_player(user_id)
         
         # Check if there's a current encounter
         if not player.current_encounter:
-            embed = discord.Embed(
-                title="❌ No Pokemon to Catch",
-                description="You need to encounter a Pokemon first! Use `!encounter` or `/encounter` to find a wild Pokemon.",
-                color=discord.Color.red()
-            )
-            await unified_ctx.send_error(embed)
+            await unified_ctx.send_error(_NO_POKEMON_TO_CATCH_EMBED)
             return False
         
-        # Validate ball type using ValidationUtils
-        is_valid, error_message = ValidationUtils.validate_ball_type(ball_type)
-        if not is_valid:
-            embed = ErrorUtils.create_invalid_input_embed("ball type", ValidationUtils.VALID_BALL_TYPES)
-            await unified_ctx.send_error(embed)
+        # Validate ball type
+        ball_type = ball_type.lower().strip()
+        if ball_type not in ValidationUtils.VALID_BALL_TYPES:
+            await unified_ctx.send_error(_INVALID_BALL_TYPE_EMBED)
             return False
         
-        ball_type = ball_type.lower()
-        
         # Attempt to catch the Pokémon
         pokemon = player.current_encounter
         success, reason, catch_details = player.catch_pokemon(ball_type)
+        remaining_pokeballs = player.inventory.get_pokeball_count(ball_type)
         
         # Store the Pokémon in MongoDB only (no longer storing in JSON)
         if success:
-            # Store Pokémon data as individual fields (flattened structure)
-            pokemon_dict = {}
-            
-            # Get Pokemon data
-            if hasattr(pokemon, "to_dict"):
-                pokemon_data = pokemon.to_dict()
-            else:
-                pokemon_data = pokemon.__dict__
-                
-            # Add all Pokémon data fields directly to the root level
-            pokemon_dict.update(pokemon_data)
-            
-            # Remove catch_rate as it's not needed in storage
-            if "catch_rate" in pokemon_dict:
-                del pokemon_dict["catch_rate"]
-            last_pokemon = self.mongo_db.get_last_pokemon(user_id)
-            if last_pokemon:
-                pokemon_id = last_pokemon["id"] + 1
-            else:
-                pokemon_id = 1
-            pokemon_dict["id"] = pokemon_id
-            
-            # Add metadata
-            pokemon_dict["owner_id"] = user_id
-            pokemon_dict["caught_date"] = datetime.now().isoformat()
-            pokemon_dict["caught_with"] = ball_type
-            pokemon_dict["caught_from"] = "encounter"
-            
-            self.mongo_db.add_pokemon(pokemon_dict)
+            pokemon_id = self.mongo_db.next_pokemon_id(user_id)
+            pokemon_dict = self._build_pokemon_doc(pokemon, user_id, ball_type, "encounter", pokemon_id)
             player.pokemon_collection.append(pokemon)  # Update in-memory collection for immediate feedback
             
-        # Still save player data (but without the Pokemon)
-        self.player_db.save_player(user_id)
+            # The Pokémon insert and the player save are independent, so wait on both together
+            self.player_db.begin_catch(user_id)
+            stored = False
+            try:
+                await asyncio.gather(
+                    self.mongo_db.enqueue_pokemon(pokemon_dict),
+                    self.player_db.save_player_batched(user_id)
+                )
+                stored = True
+            finally:
+                self.player_db.record_caught_pokemon(user_id, pokemon.name, stored)
+        else:
+            # Still save player data (but without the Pokemon)
+            await self.player_db.save_player_batched(user_id)
         
         # Log comprehensive catch information
         if catch_details:
-            self._log_catch_attempt(unified_ctx.author, catch_details)
+            self._log_catch_attempt(author, catch_details)
         
         # Handle different outcomes
         if reason == "already_attempted":
-            embed = discord.Embed(
-                title="❌ Already Attempted",
-                description="You have already attempted to catch this Pokemon! Use `!encounter` or `/encounter` to find a new Pokemon.",
-                color=discord.Color.red()
-            )
-            await unified_ctx.send_error(embed)
+            await unified_ctx.send_error(_ALREADY_ATTEMPTED_EMBED)
             return False
         elif reason == "catch_limit_reached":
             remaining_catches = player.get_remaining_catches()
             cooldown_time = player.get_catch_cooldown_remaining()
             
-            embed = discord.Embed(
-                title="🕒 Catch Limit Reached",
-                description=f"You've reached your hourly catch limit (3 Pokemon per hour).\n\n"
-                           f"**Remaining catches:** {remaining_catches}/3\n"
-                           f"**Next catch available in:** {cooldown_time if cooldown_time else 'Soon'}",
-                color=discord.Color.orange()
-            )
+            embed = _CATCH_LIMIT_TEMPLATE.copy()
+            embed.description = (f"You've reached your hourly catch limit (3 Pokemon per hour).\n\n"
+                                 f"**Remaining catches:** {remaining_catches}/3\n"
+                                 f"**Next catch available in:** {cooldown_time if cooldown_time else 'Soon'}")
             await unified_ctx.send_error(embed)
             return False
         elif reason == "no_pokeball":
-            # Get the normalized ball type and proper name
-            normalized_ball_type = player.inventory._normalize_ball_type(ball_type)
-            ball_info = player.inventory.get_ball_info(normalized_ball_type)
-            ball_name = ball_info.get("name", ball_type.title() + " Balls")
+            ball_name = self._ball_display_names.get(ball_type, ball_type.title() + " Balls")
             
-            embed = discord.Embed(
-                title="❌ No Pokeballs",
-                description=f"You don't have any {ball_name}s left!",
-                color=discord.Color.red()
-            )
+            embed = _NO_POKEBALLS_TEMPLATE.copy()
+            embed.description = f"You don't have any {ball_name}s left!"
             await unified_ctx.send_error(embed)
             return False
         
@@ -232,13 +308,13 @@ class BasicPokemonCommands:
         if success:
             embed = PokemonEmbedUtils.create_catch_success_embed(
                 pokemon=pokemon,
-                user=unified_ctx.author,
+                user=author,
             )
         else:
             embed = PokemonEmbedUtils.create_catch_failure_embed(
                 pokemon=pokemon,
                 ball_type=ball_type,
-                remaining_pokeballs=player.inventory.get_pokeball_count(ball_type)
+                remaining_pokeballs=remaining_pokeballs
             )
         
         await unified_ctx.send(embed=embed)
@@ -262,27 +338,24 @@ class BasicPokemonCommands:
             await unified_ctx.send_error(embed)
             return False
         
-        user_id = str(unified_ctx.author.id)
+        author = unified_ctx.author
+        user_id = str(author.id)
+        display_name = author.display_name
         player = self.player_db.get_player(user_id)
         
         # Check if user has already attempted to catch this wild Pokémon
         if self.wild_spawn.has_user_attempted_catch(user_id):
-            embed = ErrorUtils.create_already_attempted_embed("catch this wild Pokemon")
-            await unified_ctx.send_error(embed)
+            await unified_ctx.send_error(_WILD_ALREADY_ATTEMPTED_EMBED)
             return False
         
         # Check if there's a current wild Pokemon
         if not self.wild_spawn.is_wild_pokemon_available():
-            embed = ErrorUtils.create_no_pokemon_embed("catch")
-            embed.description = "There's no wild Pokemon available to catch right now!\nWait for the next wild spawn (every 30 minutes)."
-            await unified_ctx.send_error(embed)
+            await unified_ctx.send_error(_WILD_NOT_AVAILABLE_EMBED)
             return False
         
         # Check if player has pokeballs
         if not player.inventory.has_pokeball("poke"):  # Updated to use poke
-            embed = ErrorUtils.create_insufficient_items_embed("Poké Balls")
-            embed.description = "You don't have any Poké Balls left! Wild Pokemon can only be caught with Poké Balls."
-            await unified_ctx.send_error(embed)
+            await unified_ctx.send_error(_WILD_NO_POKEBALLS_EMBED)
             return False
         
         # Check catch limit (5 catches per hour)
@@ -290,92 +363,70 @@ class BasicPokemonCommands:
             remaining_catches = player.get_remaining_catches()
             cooldown_time = player.get_catch_cooldown_remaining()
             
-            embed = discord.Embed(
-                title="🕒 Catch Limit Reached",
-                description=f"You've reached your hourly catch limit (3 Pokemon per hour).\n\n"
-                           f"**Remaining catches:** {remaining_catches}/3\n"
-                           f"**Next catch available in:** {cooldown_time if cooldown_time else 'Soon'}",
-                color=discord.Color.orange()
-            )
+            embed = _CATCH_LIMIT_TEMPLATE.copy()
+            embed.description = (f"You've reached your hourly catch limit (3 Pokemon per hour).\n\n"
+                                 f"**Remaining catches:** {remaining_catches}/3\n"
+                                 f"**Next catch available in:** {cooldown_time if cooldown_time else 'Soon'}")
             await unified_ctx.send_error(embed)
             return False
         
         # Get the wild Pokémon
         wild_pokemon = self.wild_spawn.get_current_wild_pokemon()
         if not wild_pokemon:
-            embed = discord.Embed(
-                title="❌ No Wild Pokemon",
-                description="There's no wild Pokemon available to catch right now!",
-                color=discord.Color.red()
-            )
-            await unified_ctx.send_error(embed)
+            await unified_ctx.send_error(_NO_WILD_POKEMON_EMBED)
             return False
         
         ball_type = "poke"
         success = player.catch_wild_pokemon(wild_pokemon)
-        self.player_db.save_player(user_id)
+        remaining_balls = player.inventory.poke_balls
         
         # Record the catch attempt
-        self.wild_spawn.record_catch_attempt(user_id, unified_ctx.author.display_name, success)
+        self.wild_spawn.record_catch_attempt(user_id, display_name, success)
         
         if success:
             # Mark as caught in wild spawn system
-            self.wild_spawn.mark_pokemon_caught(user_id, unified_ctx.author.display_name)
+            self.wild_spawn.mark_pokemon_caught(user_id, display_name)
             
             # Store Pokémon in MongoDB
-            pokemon_dict = {}
-            
-            # Get Pokemon data
-            if hasattr(wild_pokemon, "to_dict"):
-                pokemon_data = wild_pokemon.to_dict()
-            else:
-                pokemon_data = wild_pokemon.__dict__
-                
-            # Add all Pokémon data fields directly to the root level
-            pokemon_dict.update(pokemon_data)
-            
-            # Remove catch_rate as it's not needed in storage
-            if "catch_rate" in pokemon_dict:
-                del pokemon_dict["catch_rate"]
-
-
-            last_pokemon = self.mongo_db.get_last_pokemon(user_id)
-            if last_pokemon:
-                pokemon_id = last_pokemon["id"] + 1
-            else:
-                pokemon_id = 1
-            pokemon_dict["id"] = pokemon_id
-            pokemon_dict["id"] = pokemon_id
+            pokemon_id = self.mongo_db.next_pokemon_id(user_id)
+            pokemon_dict = self._build_pokemon_doc(wild_pokemon, user_id, ball_type, "wild_spawn", pokemon_id)
+            # catch_wild_pokemon already added the CaughtPokemon in memory; align its ID with the stored document
+            player.pokemon_collection[-1].collection_id = pokemon_id
             
-            # Add metadata
-            pokemon_dict["owner_id"] = user_id
-            pokemon_dict["caught_date"] = datetime.now().isoformat()
-            pokemon_dict["caught_with"] = ball_type
-            pokemon_dict["caught_from"] = "wild_spawn"
-            
-            self.mongo_db.add_pokemon(pokemon_dict)
-            player.pokemon_collection.append(CaughtPokemon.from_dict(pokemon_dict))  # Update in-memory collection for immediate feedback
+            # The Pokémon insert and the player save are independent, so wait on both together
+            self.player_db.begin_catch(user_id)
+            stored = False
+            try:
+                await asyncio.gather(
+                    self.mongo_db.enqueue_pokemon(pokemon_dict),
+                    self.player_db.save_player_batched(user_id)
+                )
+                stored = True
+            finally:
+                self.player_db.record_caught_pokemon(user_id, wild_pokemon.name, stored)
             
             embed = discord.Embed(
                 title="🎉 Pokemon Caught!",
-                description=f"**Congratulations {unified_ctx.author.mention}!**\n\nYou successfully caught the wild **{wild_pokemon.name}**!\nIt's now part of your collection.",
+                description=f"**Congratulations {author.mention}!**\n\nYou successfully caught the wild **{wild_pokemon.name}**!\nIt's now part of your collection.",
                 color=PokemonTypeUtils.get_type_color(wild_pokemon.types)
             )
             embed.set_image(url=wild_pokemon.image_url)
-            embed.set_thumbnail(url=unified_ctx.author.display_avatar.url)
-            
-            # Add Pokemon info
-            embed.add_field(name="Type", value=PokemonTypeUtils.format_types(wild_pokemon.types), inline=True)
-            embed.add_field(name="Rarity", value=f"{wild_pokemon.rarity}", inline=True)
-            embed.add_field(name="Collection ID", value=f"#{len(player.pokemon_collection)}", inline=True)
+            embed.set_thumbnail(url=author.display_avatar.url)
             
-            # Simple achievement text
+            # Fill the Pokemon info and achievement text into the field template
             total_caught = len(player.pokemon_collection)
-            embed.add_field(name="🏆 Victory!", value=f"You caught the wild {wild_pokemon.name}!\nTotal Pokemon: {total_caught}", inline=False)
+            fields = [dict(field) for field in _WILD_CATCH_SUCCESS_FIELDS]
+            fields[0]["value"] = PokemonTypeUtils.format_types(wild_pokemon.types)
+            fields[1]["value"] = f"{wild_pokemon.rarity}"
+            fields[2]["value"] = f"#{total_caught}"
+            fields[3]["value"] = f"You caught the wild {wild_pokemon.name}!\nTotal Pokemon: {total_caught}"
+            embed._fields = fields
             
-            embed.set_footer(text=f"Caught by {unified_ctx.author.display_name}")
+            embed.set_footer(text=f"Caught by {display_name}")
             
         else:
+            await self.player_db.save_player_batched(user_id)
+            
             embed = discord.Embed(
                 title="💨 Pokemon Escaped!",
                 description=f"The wild **{wild_pokemon.name}** broke free! Other trainers can still try to catch it.",
@@ -385,7 +436,6 @@ class BasicPokemonCommands:
             embed.add_field(name="Still Available", value="The Pokemon is still available for others to catch!", inline=False)
         
         # Add remaining pokeball count
-        remaining_balls = player.inventory.poke_balls
         embed.add_field(name="Poké Balls Remaining", value=f"{remaining_balls}", inline=True)
         
         await unified_ctx.send(embed=embed)
@@ -408,7 +458,8 @@ class BasicPokemonCommands:
             wild_pokemon = self.wild_spawn.get_current_wild_pokemon()
             if wild_pokemon:
                 # Check if player already owns this Pokemon
-                already_owned = self.mongo_db.has_pokemon_by_name(user_id, wild_pokemon.name)
+                owned_counts = await self.player_db.get_owned_counts(user_id)
+                already_owned = owned_counts[wild_pokemon.name] > 0
                 ownership_status = "✅ You already have this Pokémon!" if already_owned else "❌ New Pokémon! You don't have this one yet."
                 
                 embed.description = f"**A wild {wild_pokemon.name} is currently available!**\n\n{ownership_status}"
@@ -435,19 +486,17 @@ class BasicPokemonCommands:
         Shared logic for both prefix and slash daily claim commands
         Returns True if successful, False if failed
         """
-        user_id = str(unified_ctx.author.id)
+        author = unified_ctx.author
+        user_id = str(author.id)
         player = self.player_db.get_player(user_id)
         
         # Check if daily claim is available
         if not player.can_claim_daily_bonus():
             cooldown_time = player.get_daily_claim_cooldown_remaining()
             
-            embed = discord.Embed(
-                title="🕒 Daily Bonus Already Claimed",
-                description="You've already claimed your daily bonus!\n\n"
-                           f"**Next claim available in:** {cooldown_time if cooldown_time else 'Soon'}",
-                color=discord.Color.orange()
-            )
+            embed = _DAILY_CLAIMED_TEMPLATE.copy()
+            embed.description = ("You've already claimed your daily bonus!\n\n"
+                                 f"**Next claim available in:** {cooldown_time if cooldown_time else 'Soon'}")
             embed.add_field(
                 name="💰 Current Balance", 
                 value=f"{player.pokecoins:,} PokéCoins", 
@@ -463,7 +512,7 @@ class BasicPokemonCommands:
         if success:
             embed = discord.Embed(
                 title="🎁 Daily Bonus Claimed!",
-                description=f"**Congratulations {unified_ctx.author.mention}!**\n\n"
+                description=f"**Congratulations {author.mention}!**\n\n"
                            f"You've claimed your daily bonus!",
                 color=discord.Color.gold()
             )
@@ -488,19 +537,14 @@ class BasicPokemonCommands:
                 inline=True
             )
             
-            embed.set_thumbnail(url=unified_ctx.author.display_avatar.url)
-            embed.set_footer(text=f"Daily bonus claimed by {unified_ctx.author.display_name}")
+            embed.set_thumbnail(url=author.display_avatar.url)
+            embed.set_footer(text=f"Daily bonus claimed by {author.display_name}")
             
             await unified_ctx.send(embed=embed)
             return True
         
         # Should not reach here, but handle just in case
-        embed = discord.Embed(
-            title="❌ Claim Failed",
-            description="Failed to claim daily bonus. Please try again later.",
-            color=discord.Color.red()
-        )
-        await unified_ctx.send_error(embed)
+        await unified_ctx.send_error(_CLAIM_FAILED_EMBED)
         return False
     
     async def check_pokemon_logic(self, unified_ctx: UnifiedContext, pokemon_name: str) -> bool:
@@ -508,7 +552,9 @@ class BasicPokemonCommands:
         Shared logic for checking if player owns a specific Pokémon
         Returns True if successful, False if failed
         """
-        user_id = str(unified_ctx.author.id)
+        author = unified_ctx.author
+        user_id = str(author.id)
+        mention = author.mention
         
         # Capitalize pokemon name properly
         pokemon_name_formatted = pokemon_name.strip().title()
@@ -516,28 +562,21 @@ class BasicPokemonCommands:
         # Check if the pokemon exists in the database
         pokemon_data = self.pokemon_db.get_pokemon_by_name(pokemon_name_formatted)
         if not pokemon_data:
-            embed = discord.Embed(
-                title="❌ Pokémon Not Found",
-                description=f"**{pokemon_name_formatted}** doesn't exist in the Pokémon database.\n\nPlease check the spelling and try again.",
-                color=discord.Color.red()
-            )
+            embed = _POKEMON_NOT_FOUND_TEMPLATE.copy()
+            embed.description = f"**{pokemon_name_formatted}** doesn't exist in the Pokémon database.\n\nPlease check the spelling and try again."
             await unified_ctx.send_error(embed)
             return False
         
-        # Check if player owns this pokemon
-        has_pokemon = self.mongo_db.has_pokemon_by_name(user_id, pokemon_data.name)
-        
         # Count how many of this pokemon the player has
-        owned_count = self.mongo_db.caught_pokemon.count_documents({
-            "owner_id": user_id,
-            "name": pokemon_data.name
-        })
+        owned_counts = await self.player_db.get_owned_counts(user_id)
+        owned_count = owned_counts[pokemon_data.name]
+        has_pokemon = owned_count > 0
         
         # Create embed based on ownership
         if has_pokemon:
             embed = discord.Embed(
                 title="✅ Pokémon Found in Collection!",
-                description=f"**{unified_ctx.author.mention}** owns **{pokemon_data.name}**!",
+                description=f"**{mention}** owns **{pokemon_data.name}**!",
                 color=discord.Color.green()
             )
             embed.add_field(
@@ -548,7 +587,7 @@ class BasicPokemonCommands:
         else:
             embed = discord.Embed(
                 title="❌ Pokémon Not in Collection",
-                description=f"**{unified_ctx.author.mention}** doesn't own **{pokemon_data.name}** yet.",
+                description=f"**{mention}** doesn't own **{pokemon_data.name}** yet.",
                 color=discord.Color.red()
             )
             embed.add_field(
@@ -564,7 +603,7 @@ class BasicPokemonCommands:
         embed.add_field(name="Pokedex #", value=f"#{pokemon_data.id}", inline=True)
         
         embed.set_thumbnail(url=pokemon_data.sprite_url)
-        embed.set_footer(text=f"Check requested by {unified_ctx.author.display_name}")
+        embed.set_footer(text=f"Check requested by {author.display_name}")
         
         await unified_ctx.send(embed=embed)
         return True
@@ -575,30 +614,27 @@ class BasicPokemonCommands:
         Shows Pokémon that target_user has but the requester doesn't have
         Returns True if successful, False if failed
         """
-        requester_id = str(unified_ctx.author.id)
+        author = unified_ctx.author
+        requester_id = str(author.id)
         target_id = str(target_user.id)
+        target_name = target_user.display_name
         
         # Check if trying to check themselves
         if requester_id == target_id:
-            embed = discord.Embed(
-                title="❌ Invalid User",
-                description="You can't trade check yourself! Please mention another user.",
-                color=discord.Color.red()
-            )
-            await unified_ctx.send_error(embed)
+            await unified_ctx.send_error(_INVALID_TRADE_USER_EMBED)
             return False
         
-        # Get all Pokémon owned by the requester
-        requester_pokemon = self.mongo_db.get_pokemon_by_owner(requester_id)
+        # Get all Pokémon owned by the requester and the target user in one query
+        requester_pokemon, target_pokemon = await asyncio.gather(
+            self.mongo_db.get_pokemon_by_owner_async(requester_id),
+            self.mongo_db.get_pokemon_by_owner_async(target_id)
+        )
         requester_pokemon_names = set(p.get("name") for p in requester_pokemon if p.get("name"))
         
-        # Get all Pokémon owned by the target user
-        target_pokemon = self.mongo_db.get_pokemon_by_owner(target_id)
-        
         if not target_pokemon:
             embed = discord.Embed(
                 title="❌ No Pokémon Found",
-                description=f"**{target_user.display_name}** doesn't have any Pokémon yet!",
+                description=f"**{target_name}** doesn't have any Pokémon yet!",
                 color=discord.Color.red()
             )
             await unified_ctx.send_error(embed)
@@ -621,7 +657,7 @@ class BasicPokemonCommands:
         if not trade_candidates:
             embed = discord.Embed(
                 title="✅ Complete Match!",
-                description=f"You already have all the Pokémon that **{target_user.display_name}** has!\n\nNo trade opportunities available.",
+                description=f"You already have all the Pokémon that **{target_name}** has!\n\nNo trade opportunities available.",
                 color=discord.Color.green()
             )
             await unified_ctx.send(embed=embed)
@@ -632,9 +668,9 @@ class BasicPokemonCommands:
         
         # Create embed
         embed = discord.Embed(
-            title=f"🔄 Trade Check: {target_user.display_name}",
-            description=f"**{unified_ctx.author.mention}** is checking trade opportunities with **{target_user.mention}**\n\n"
-                       f"Showing Pokémon that {target_user.display_name} has but you don't:",
+            title=f"🔄 Trade Check: {target_name}",
+            description=f"**{author.mention}** is checking trade opportunities with **{target_user.mention}**\n\n"
+                       f"Showing Pokémon that {target_name} has but you don't:",
             color=discord.Color.blue()
         )
         
@@ -676,7 +712,7 @@ class BasicPokemonCommands:
         if sorted_candidates and sorted_candidates[0][1]["sprite_url"]:
             embed.set_thumbnail(url=sorted_candidates[0][1]["sprite_url"])
         
-        embed.set_footer(text=f"Trade check requested by {unified_ctx.author.display_name}")
+        embed.set_footer(text=f"Trade check requested by {author.display_name}")
         
         await unified_ctx.send(embed=embed)
         return True
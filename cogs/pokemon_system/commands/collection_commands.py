@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import Optional
 
 import discord
@@ -9,6 +8,95 @@ from ..utils import PokemonEmbedUtils
 from ..utils.interaction_utils import UnifiedContext, create_unified_context
 from ..utils.mongo_manager import MongoManager
 
+# Rarities shown in the stats breakdown, in display order
+_RARITY_ORDER = ("Common", "Uncommon", "Rare", "Legendary")
+
+# Fields the collection list view summarizes
+_COLLECTION_PROJECTION = {
+    "_id": 0, "id": 1, "name": 1, "types": 1, "rarity": 1,
+    "caught_from": 1, "generation": 1, "caught_date": 1, "image_url": 1
+}
+
+# Fields rendered for each Pokémon on a pokedex page
+_POKEDEX_PROJECTION = {"_id": 0, "id": 1, "name": 1, "types": 1, "rarity": 1}
+
+# Party document field for each slot number
+_PARTY_SLOT_FIELDS = MongoManager.PARTY_SLOT_FIELDS
+
+# Fields rendered for each Pokémon in the party view
+_PARTY_SHOW_PROJECTION = {"_id": 0, "id": 1, "name": 1, "types": 1, "rarity": 1}
+
+# Fields shown when a Pokémon is added to or removed from a party slot
+_PARTY_SLOT_PROJECTION = {"_id": 0, "id": 1, "name": 1, "types": 1, "rarity": 1, "sprite_url": 1}
+
+# Shared skeleton of every pokedex page; title, description and fields are filled per page
+_POKEDEX_PAGE_TEMPLATE = discord.Embed(color=discord.Color.purple())
+_POKEDEX_PAGE_TEMPLATE.set_footer(text="Use the command with a page number to view other pages.")
+
+# Emoji shown next to each ball type in stats and inventory
+_BALL_EMOJI = {"poke": "⚪", "great": "🔵", "ultra": "🟡", "master": "🟣"}
+
+
+# ========== STATIC EMBEDS ==========
+# Error embeds that never change are built once at import and sent as-is;
+# templates with a per-request value are copied before being filled in.
+
+_INVALID_PARTY_INDEX_EMBED = discord.Embed(
+    title="❌ Invalid Party Index",
+    description="Party index must be a number between 1 and 6.",
+    color=discord.Color.red()
+)
+
+_INVALID_POKEMON_ID_EMBED = discord.Embed(
+    title="❌ Invalid Pokemon ID",
+    description="Pokemon ID must be a positive number.",
+    color=discord.Color.red()
+)
+_INVALID_POKEMON_ID_EMBED.add_field(name="💡 Tip", value="Use `!collection` to see valid Pokemon IDs.", inline=False)
+
+_PARTY_ADD_FAILED_EMBED = discord.Embed(
+    title="❌ Failed to Add Pokémon",
+    description="An error occurred while adding the Pokémon to your party.",
+    color=discord.Color.red()
+)
+
+_PARTY_EMPTY_EMBED = discord.Embed(
+    title="📋 Your Pokémon Party",
+    description="Your party is empty! Use `!party_add <index> <pokemon_id>` to add Pokémon.",
+    color=discord.Color.blue()
+)
+_PARTY_EMPTY_EMBED.add_field(
+    name="🔹 How to add Pokémon:",
+    value="1. Use `!collection` to see your Pokémon IDs\n2. Use `!party_add 1 25` to add Pokémon #25 to slot 1",
+    inline=False
+)
+
+_NO_PARTY_FOUND_EMBED = discord.Embed(
+    title="❌ No Party Found",
+    description="You don't have a party yet! Use `!party_add` to add Pokémon first.",
+    color=discord.Color.red()
+)
+
+_PARTY_REMOVE_FAILED_EMBED = discord.Embed(
+    title="❌ Failed to Remove Pokémon",
+    description="An error occurred while removing the Pokémon from your party.",
+    color=discord.Color.red()
+)
+
+# Templates only ever get a new description, so their shared field lists are never modified
+_INVALID_PAGE_TEMPLATE = discord.Embed(title="❌ Invalid Page Number", color=discord.Color.red())
+_SLOT_ALREADY_EMPTY_TEMPLATE = discord.Embed(title="❌ Slot Already Empty", color=discord.Color.red())
+
+_PARTY_POKEMON_NOT_FOUND_TEMPLATE = discord.Embed(title="❌ Pokémon Not Found", color=discord.Color.red())
+_PARTY_POKEMON_NOT_FOUND_TEMPLATE.add_field(
+    name="💡 Tip",
+    value="Use `!collection` to see your Pokémon and their IDs.",
+    inline=False
+)
+
+_POKEMON_NOT_FOUND_TEMPLATE = discord.Embed(title="❌ Pokemon Not Found", color=discord.Color.red())
+_POKEMON_NOT_FOUND_TEMPLATE.add_field(name="💡 Tip", value="Use the Pokemon's name or collection ID (e.g., '#5')", inline=False)
+
 
 class CollectionPokemonCommands:
     """Contains Pokémon collection management commands with shared logic architecture"""
@@ -17,6 +105,9 @@ class CollectionPokemonCommands:
         self.pokemon_db = pokemon_db
         self.player_db = player_db
         self.mongo_db = mongo_db
+        
+        # Last stats/inventory reply per (channel, user, command), reused by send_or_edit
+        self._last_replies = {}
     
     # ========== SHARED LOGIC FUNCTIONS ==========
     
@@ -26,36 +117,28 @@ class CollectionPokemonCommands:
         Returns True if successful, False if failed
         """
         # If no user mentioned, show the author's collection
+        author = unified_ctx.author
         if user is None:
-            user = unified_ctx.author
-            user_id = str(unified_ctx.author.id)
-            is_own_collection = True
-        else:
-            user_id = str(user.id)
-            is_own_collection = (user.id == unified_ctx.author.id)
-        pokemon_collection = []
-        caught_pokemons = self.mongo_db.get_pokemon_by_owner(user_id)
-        for pokemon_data in caught_pokemons:
-            caught_pokemon = CaughtPokemon.from_dict(pokemon_data)
-            pokemon_collection.append(caught_pokemon)
+            user = author
+        user_id = str(user.id)
+        is_own_collection = (user.id == author.id)
 
         if pokemon_identifier:
-            found_pokemon: Optional[CaughtPokemon] = None
-
-            if pokemon_identifier.startswith('#'):
-                for pokemon in pokemon_collection:
-                    if str(pokemon.collection_id) == pokemon_identifier[1:]:
-                        found_pokemon = pokemon
-                        break
+            # Fetch just the requested Pokémon instead of the whole collection
+            identifier = pokemon_identifier.strip()
+            pokemon_data: Optional[dict] = None
+            if identifier.startswith('#'):
+                pokemon_data = await self.mongo_db.run_in_thread(self.mongo_db.get_pokemon_by_owner_and_identifier, user_id, identifier)
             else:
-                for pokemon in pokemon_collection:
-                    if pokemon.name.lower() == pokemon_identifier.lower():
-                        found_pokemon = pokemon
-                        break
+                # Stored names use the database's casing, so resolve it before querying
+                species = self.pokemon_db.get_pokemon_by_name(identifier)
+                if species:
+                    pokemon_data = await self.mongo_db.run_in_thread(self.mongo_db.get_pokemon_by_owner_and_identifier, user_id, species.name)
 
-            if not found_pokemon:
+            if not pokemon_data:
                 await self._pokemon_not_found(unified_ctx, pokemon_identifier)
                 return False
+            found_pokemon = CaughtPokemon.from_dict(pokemon_data)
 
             # Create detailed Pokémon embed
             embed = PokemonEmbedUtils.create_cached_pokemon_detail_embed(
@@ -65,10 +148,13 @@ class CollectionPokemonCommands:
             await unified_ctx.send(embed=embed)
             return True
         
+        # The list view only summarizes, so it renders the projected documents directly
+        pokemon_documents = await self.mongo_db.get_pokemon_by_owner_async(user_id, _COLLECTION_PROJECTION)
+        
         # Create collection embed
-        embed = PokemonEmbedUtils.create_collection_embed(
+        embed = PokemonEmbedUtils.create_collection_embed_from_dicts(
             player_name=user.display_name,
-            pokemon_collection=pokemon_collection,
+            pokemon_documents=pokemon_documents,
             is_own_collection=is_own_collection,
             user_mention=user.mention
         )
@@ -81,58 +167,49 @@ class CollectionPokemonCommands:
         Shared logic for both prefix and slash stats commands
         Returns True if successful, False if failed
         """
-        user_id = str(unified_ctx.author.id)
+        author = unified_ctx.author
+        user_id = str(author.id)
+        display_name = author.display_name
+        avatar_url = author.display_avatar.url
         player = self.player_db.get_player(user_id)
         
-        # Create stats embed
-        embed = discord.Embed(
-            title=f"📊 {unified_ctx.author.display_name}'s Pokemon Stats",
-            color=discord.Color.blue()
-        )
-        
-        embed.set_thumbnail(url=unified_ctx.author.display_avatar.url)
-        
         # Basic stats
         total_caught = len(player.pokemon_collection)
         total_encounters = player.stats.total_encounters
-        catch_rate = player.stats.get_catch_rate()
         
-        embed.add_field(name="🎯 Total Caught", value=f"{total_caught}", inline=True)
-        embed.add_field(name="👁️ Total Encounters", value=f"{total_encounters}", inline=True)
-        embed.add_field(name="📈 Catch Rate", value=f"{catch_rate:.1f}%", inline=True)
-        
-        # Currency
-        embed.add_field(name="💰 PokéCoins", value=f"{player.pokecoins:,}", inline=True)
-        
-        # Join date
-        join_date = datetime.fromisoformat(player.stats.join_date).strftime("%B %d, %Y")
-        embed.add_field(name="📅 Trainer Since", value=join_date, inline=True)
-        
-        # Enhanced Pokeball Inventory with icons
-        all_balls = player.inventory.get_all_balls()
-        pokeball_text = ""
-        for ball_type, ball_data in all_balls.items():
-            if ball_data["count"] > 0:
-                # Use emoji as fallback if icon URL fails
-                emoji = {"poke": "⚪", "great": "🔵", "ultra": "🟡", "master": "🟣"}.get(ball_type, "⚫")
-                pokeball_text += f"{emoji} {ball_data['name']}: {ball_data['count']}\n"
-        
-        if not pokeball_text:
-            pokeball_text = "No poke balls"
-            
-        embed.add_field(name="� Pokeball Inventory", value=pokeball_text, inline=True)
+        # Enhanced Pokeball Inventory with icons (emoji as fallback if icon URL fails)
+        pokeball_text = "".join(
+            f"{_BALL_EMOJI.get(ball.type, '⚫')} {ball.name}: {ball.count}\n"
+            for ball in player.inventory.get_all_balls_cached() if ball.count
+        ) or "No poke balls"
+        
+        fields = [
+            {"name": "🎯 Total Caught", "value": f"{total_caught}", "inline": True},
+            {"name": "👁️ Total Encounters", "value": f"{total_encounters}", "inline": True},
+            {"name": "📈 Catch Rate", "value": player.stats.catch_rate_display, "inline": True},
+            # Currency
+            {"name": "💰 PokéCoins", "value": f"{player.pokecoins:,}", "inline": True},
+            # Join date
+            {"name": "📅 Trainer Since", "value": player.stats.join_date_display, "inline": True},
+            {"name": "� Pokeball Inventory", "value": pokeball_text, "inline": True},
+        ]
         
         # Rarity breakdown
         if player.pokemon_collection:
-            rarity_counts = {"Common": 0, "Uncommon": 0, "Rare": 0, "Legendary": 0}
-            for pokemon in player.pokemon_collection:
-                if pokemon.rarity in rarity_counts:
-                    rarity_counts[pokemon.rarity] += 1
-            
-            rarity_text = " | ".join([f"{rarity}: {count}" for rarity, count in rarity_counts.items() if count > 0])
-            embed.add_field(name="⭐ Collection Breakdown", value=rarity_text, inline=False)
-        
-        await unified_ctx.send(embed=embed)
+            rarity_counts = player.get_rarity_counts()
+            rarity_text = " | ".join(f"{rarity}: {rarity_counts[rarity]}" for rarity in _RARITY_ORDER if rarity_counts[rarity] > 0)
+            fields.append({"name": "⭐ Collection Breakdown", "value": rarity_text, "inline": False})
+        
+        # Create stats embed in one pass from its payload
+        embed = discord.Embed.from_dict({
+            "type": "rich",
+            "title": f"📊 {display_name}'s Pokemon Stats",
+            "color": discord.Color.blue().value,
+            "thumbnail": {"url": avatar_url},
+            "fields": fields,
+        })
+        
+        await unified_ctx.send_or_edit(embed, self._last_replies, (unified_ctx.channel.id, user_id, "stats"))
         return True
     
     async def pokemon_inventory_logic(self, unified_ctx: UnifiedContext) -> bool:
@@ -140,30 +217,25 @@ class CollectionPokemonCommands:
         Shared logic for both prefix and slash inventory commands
         Returns True if successful, False if failed
         """
-        user_id = str(unified_ctx.author.id)
+        author = unified_ctx.author
+        user_id = str(author.id)
+        display_name = author.display_name
+        avatar_url = author.display_avatar.url
         player = self.player_db.get_player(user_id)
         
         embed = discord.Embed(
-            title=f"🎒 {unified_ctx.author.display_name}'s Inventory",
+            title=f"🎒 {display_name}'s Inventory",
             description="Your Pokemon game items and resources",
             color=discord.Color.green()
         )
         
-        embed.set_thumbnail(url=unified_ctx.author.display_avatar.url)
+        embed.set_thumbnail(url=avatar_url)
         
-        # Enhanced Pokeball Inventory
-        all_balls = player.inventory.get_all_balls()
-        pokeball_text = ""
-        
-        for ball_type, ball_data in all_balls.items():
-            count = ball_data["count"]
-            if count > 0:
-                # Use emoji as fallback
-                emoji = {"poke": "⚪", "great": "🔵", "ultra": "🟡", "master": "🟣"}.get(ball_type, "⚫")
-                pokeball_text += f"{emoji} {ball_data['name']}: **{count}**\n"
-        
-        if not pokeball_text:
-            pokeball_text = "No poke balls in inventory"
+        # Enhanced Pokeball Inventory (emoji as fallback)
+        pokeball_text = "".join(
+            f"{_BALL_EMOJI.get(ball.type, '⚫')} {ball.name}: **{ball.count}**\n"
+            for ball in player.inventory.get_all_balls_cached() if ball.count
+        ) or "No poke balls in inventory"
             
         embed.add_field(name="� Pokeball Inventory", value=pokeball_text, inline=False)
         
@@ -173,7 +245,7 @@ class CollectionPokemonCommands:
         # Stats
         total_caught = len(player.pokemon_collection)
         embed.add_field(name="📦 Pokemon Owned", value=f"{total_caught}", inline=True)
-        embed.add_field(name="📊 Catch Rate", value=f"{player.stats.get_catch_rate():.1f}%", inline=True)
+        embed.add_field(name="📊 Catch Rate", value=player.stats.catch_rate_display, inline=True)
         
         # Current encounter
         if player.current_encounter:
@@ -181,7 +253,7 @@ class CollectionPokemonCommands:
         else:
             embed.add_field(name="🌿 Current Encounter", value="None", inline=True)
         
-        await unified_ctx.send(embed=embed)
+        await unified_ctx.send_or_edit(embed, self._last_replies, (unified_ctx.channel.id, user_id, "inventory"))
         return True
 
     async def pokedex_page_logic(self, unified_ctx: UnifiedContext, page_number: int, only_show_duplicates: bool) -> bool:
@@ -189,63 +261,49 @@ class CollectionPokemonCommands:
         Shared logic for both prefix and slash Pokédex page commands
         Returns True if successful, False if failed
         """
+        author = unified_ctx.author
+        user_id = str(author.id)
         pokedex_per_page = 10
-        duplicate_names = {}
         if only_show_duplicates:
-            # Get all Pokémon and filter for duplicates
-            all_pokemons = self.mongo_db.get_pokemon_by_owner(str(unified_ctx.author.id))
-            name_count = {}
-            for p in all_pokemons:
-                name = p.get('name')
-                name_count[name] = name_count.get(name, 0) + 1
-            for name in name_count:
-                if name_count[name] > 1:
-                    duplicate_names[name] = name_count[name]
-            total_pokemon = len(duplicate_names)
+            # One aggregation returns both the duplicate total and the requested page
+            total_pokemon, duplicate_name_counts = await self.mongo_db.run_in_thread(
+                self.mongo_db.get_duplicate_name_page,
+                user_id,
+                skip=max(page_number - 1, 0) * pokedex_per_page,
+                limit=pokedex_per_page
+            )
         else:
-            total_pokemon = self.mongo_db.count_pokemon_by_owner(str(unified_ctx.author.id))
+            # One aggregation returns both the requested page and the owned total
+            pokemons_on_page, total_pokemon = await self.mongo_db.run_in_thread(
+                self.mongo_db.get_pokemon_page_with_count,
+                user_id,
+                page=page_number,
+                max_per_page=pokedex_per_page,
+                projection=_POKEDEX_PROJECTION
+            )
 
         total_pages = (total_pokemon + pokedex_per_page - 1) // pokedex_per_page
 
         if page_number < 1 or page_number > total_pages:
-            embed = discord.Embed(
-                title="❌ Invalid Page Number",
-                description=f"Please enter a page number between 1 and {total_pages}.",
-                color=discord.Color.red()
-            )
+            embed = _INVALID_PAGE_TEMPLATE.copy()
+            embed.description = f"Please enter a page number between 1 and {total_pages}."
             await unified_ctx.send(embed=embed)
             return False
 
-        embed = discord.Embed(
-            title=f"📖 Pokédex - Page {page_number}/{total_pages}",
-            description="List of Pokémon in the database",
-            color=discord.Color.purple()
-        )
+        embed = _POKEDEX_PAGE_TEMPLATE.copy()
+        embed.title = f"📖 Pokédex - Page {page_number}/{total_pages}"
+        embed.description = "List of Pokémon in the database"
 
-        if duplicate_names:
+        if only_show_duplicates:
             embed.description += " (Showing Duplicates Only)"
-            duplicate_names = dict(
-                sorted(duplicate_names.items(), key=lambda item: item[1], reverse=True)
-            )
-            start_index = (page_number - 1) * pokedex_per_page
-            end_index = start_index + pokedex_per_page
-            duplicate_name_count = dict(list(duplicate_names.items())[start_index:end_index])
-            for (name, count) in duplicate_name_count.items():
-                if count > 1:
-                    embed.add_field(
-                        name=f"{name}",
-                        value=f"Count: {count}",
-                        inline=False
-                    )
+            for entry in duplicate_name_counts:
+                embed.add_field(
+                    name=f"{entry['_id']}",
+                    value=f"Count: {entry['count']}",
+                    inline=False
+                )
 
         else:
-            # Fetch Pokémon for the requested page
-            pokemons_on_page = self.mongo_db.get_pokemon_by_owner(
-                str(unified_ctx.author.id),
-                page=page_number,
-                max_per_page = pokedex_per_page
-            )
-
             for pokemon in pokemons_on_page:
                 embed.add_field(
                     name=f"#{pokemon.get('id')} {pokemon.get('name')}",
@@ -253,10 +311,6 @@ class CollectionPokemonCommands:
                     inline=False
                 )
 
-        embed.set_footer(text=f"Requested by {unified_ctx.author.mention}")
-
-        embed.set_footer(text="Use the command with a page number to view other pages.")
-
         await unified_ctx.send(embed=embed)
         return True
     
@@ -268,19 +322,20 @@ class CollectionPokemonCommands:
         
         # Find Pokémon by ID or name
         found_pokemon = None
+        identifier = pokemon_identifier.strip()
         
         # Check if it's a collection ID (starts with #)
-        if pokemon_identifier.startswith('#'):
-            try:
-                collection_id = int(pokemon_identifier[1:])
-                found_pokemon = self.pokemon_db.get_pokemon_by_id(collection_id)
-            except ValueError:
-                pass
+        if identifier.startswith('#'):
+            number = identifier[1:]
+            if number.isdigit():
+                found_pokemon = self.pokemon_db.get_pokemon_by_id(int(number))
         else:
-            # Search by name
-            pokemons = self.pokemon_db.search_pokemon(pokemon_identifier)
-            if pokemons:
-                found_pokemon = pokemons[0]
+            # Exact name first, then the first partial match
+            found_pokemon = self.pokemon_db.get_pokemon_by_name(identifier)
+            if not found_pokemon:
+                pokemons = self.pokemon_db.search_pokemon(identifier, limit=1)
+                if pokemons:
+                    found_pokemon = pokemons[0]
         
         if not found_pokemon:
             await self._pokemon_not_found(unified_ctx, pokemon_identifier)
@@ -297,12 +352,8 @@ class CollectionPokemonCommands:
 
     @staticmethod
     async def _pokemon_not_found(unified_ctx: UnifiedContext, identifier: str):
-        embed = discord.Embed(
-            title="❌ Pokemon Not Found",
-            description=f"Could not find a Pokemon matching '{identifier}'.",
-            color=discord.Color.red()
-        )
-        embed.add_field(name="💡 Tip", value="Use the Pokemon's name or collection ID (e.g., '#5')", inline=False)
+        embed = _POKEMON_NOT_FOUND_TEMPLATE.copy()
+        embed.description = f"Could not find a Pokemon matching '{identifier}'."
         await unified_ctx.send(embed=embed)
     
     # ========== LEGACY PREFIX COMMANDS ==========
@@ -343,65 +394,31 @@ class CollectionPokemonCommands:
         
         # Validate index
         if not isinstance(index, int) or not (1 <= index <= 6):
-            embed = discord.Embed(
-                title="❌ Invalid Party Index",
-                description="Party index must be a number between 1 and 6.",
-                color=discord.Color.red()
-            )
-            await unified_ctx.send(embed=embed)
+            await unified_ctx.send(embed=_INVALID_PARTY_INDEX_EMBED)
             return False
         
         # Validate pokemon_id
         if not isinstance(pokemon_id, int) or pokemon_id <= 0:
-            embed = discord.Embed(
-                title="❌ Invalid Pokemon ID",
-                description="Pokemon ID must be a positive number.",
-                color=discord.Color.red()
-            )
-            embed.add_field(
-                name="💡 Tip", 
-                value="Use `!collection` to see valid Pokemon IDs.", 
-                inline=False
-            )
-            await unified_ctx.send(embed=embed)
+            await unified_ctx.send(embed=_INVALID_POKEMON_ID_EMBED)
             return False
         
-        # Check if user owns the Pokémon
-        user_pokemon = self.mongo_db.get_pokemon_by_owner(user_id)
-        owned_pokemon = None
-        
-        for pokemon in user_pokemon:
-            if pokemon.get('id') == pokemon_id:
-                owned_pokemon = pokemon
-                break
+        # Check if user owns the Pokémon with an indexed point read
+        owned = await self.mongo_db.run_in_thread(self.mongo_db.get_pokemon_by_owner_and_ids, user_id, [pokemon_id], _PARTY_SLOT_PROJECTION)
+        owned_pokemon = owned[0] if owned else None
         
         if not owned_pokemon:
-            embed = discord.Embed(
-                title="❌ Pokémon Not Found",
-                description=f"You don't own a Pokémon with ID #{pokemon_id}.",
-                color=discord.Color.red()
-            )
-            embed.add_field(
-                name="💡 Tip", 
-                value="Use `!collection` to see your Pokémon and their IDs.", 
-                inline=False
-            )
+            embed = _PARTY_POKEMON_NOT_FOUND_TEMPLATE.copy()
+            embed.description = f"You don't own a Pokémon with ID #{pokemon_id}."
             await unified_ctx.send(embed=embed)
             return False
         
-        # Check if Pokémon is already in party
-        existing_party = self.mongo_db.get_party(user_id)
-        if existing_party:
-            slot_map = {
-                1: "first_pokemon",
-                2: "second_pokemon",
-                3: "third_pokemon", 
-                4: "fourth_pokemon",
-                5: "fifth_pokemon",
-                6: "sixth_pokemon"
-            }
-            
-            for slot_num, slot_field in slot_map.items():
+        # Add Pokémon to party; the write itself refuses a Pokémon already in another slot
+        success = await self.mongo_db.run_in_thread(self.mongo_db.add_pokemon_to_party, user_id, index, pokemon_id)
+        
+        if not success:
+            # Only a failed add needs the party, to report which slot holds the Pokémon
+            existing_party = await self.mongo_db.run_in_thread(self.mongo_db.get_party, user_id) or {}
+            for slot_num, slot_field in _PARTY_SLOT_FIELDS.items():
                 if existing_party.get(slot_field) == pokemon_id and slot_num != index:
                     embed = discord.Embed(
                         title="❌ Pokémon Already in Party",
@@ -415,113 +432,76 @@ class CollectionPokemonCommands:
                     )
                     await unified_ctx.send(embed=embed)
                     return False
-        
-        # Add Pokémon to party
-        success = self.mongo_db.add_pokemon_to_party(user_id, index, pokemon_id)
-        
-        if success:
-            embed = discord.Embed(
-                title="✅ Pokémon Added to Party",
-                description=f"**{owned_pokemon['name']}** (#{pokemon_id}) has been added to party slot {index}!",
-                color=discord.Color.green()
-            )
             
-            # Add Pokémon details
-            embed.add_field(name="Name", value=owned_pokemon['name'], inline=True)
-            embed.add_field(name="Type", value=", ".join(owned_pokemon['types']), inline=True)
-            embed.add_field(name="Rarity", value=owned_pokemon['rarity'], inline=True)
-            embed.add_field(name="Party Slot", value=f"Position {index}", inline=True)
-            
-            if 'sprite_url' in owned_pokemon and owned_pokemon['sprite_url']:
-                embed.set_thumbnail(url=owned_pokemon['sprite_url'])
-            
-            await unified_ctx.send(embed=embed)
-            return True
-        else:
-            embed = discord.Embed(
-                title="❌ Failed to Add Pokémon",
-                description="An error occurred while adding the Pokémon to your party.",
-                color=discord.Color.red()
-            )
-            await unified_ctx.send(embed=embed)
+            await unified_ctx.send(embed=_PARTY_ADD_FAILED_EMBED)
             return False
+        
+        embed = discord.Embed(
+            title="✅ Pokémon Added to Party",
+            description=f"**{owned_pokemon['name']}** (#{pokemon_id}) has been added to party slot {index}!",
+            color=discord.Color.green()
+        )
+        
+        # Add Pokémon details
+        embed.add_field(name="Name", value=owned_pokemon['name'], inline=True)
+        embed.add_field(name="Type", value=", ".join(owned_pokemon['types']), inline=True)
+        embed.add_field(name="Rarity", value=owned_pokemon['rarity'], inline=True)
+        embed.add_field(name="Party Slot", value=f"Position {index}", inline=True)
+        
+        if 'sprite_url' in owned_pokemon and owned_pokemon['sprite_url']:
+            embed.set_thumbnail(url=owned_pokemon['sprite_url'])
+        
+        await unified_ctx.send(embed=embed)
+        return True
     
     async def party_show_logic(self, unified_ctx: UnifiedContext) -> bool:
         """
         Shared logic for showing user's party
         Returns True if successful, False if failed
         """
-        user_id = str(unified_ctx.author.id)
+        author = unified_ctx.author
+        user_id = str(author.id)
         
         # Get user's party
-        party = self.mongo_db.get_party(user_id)
+        party = await self.mongo_db.run_in_thread(self.mongo_db.get_party, user_id)
         
         if not party:
-            embed = discord.Embed(
-                title="📋 Your Pokémon Party",
-                description="Your party is empty! Use `!party_add <index> <pokemon_id>` to add Pokémon.",
-                color=discord.Color.blue()
-            )
-            embed.add_field(
-                name="🔹 How to add Pokémon:", 
-                value="1. Use `!collection` to see your Pokémon IDs\n2. Use `!party_add 1 25` to add Pokémon #25 to slot 1", 
-                inline=False
-            )
-            await unified_ctx.send(embed=embed)
+            await unified_ctx.send(embed=_PARTY_EMPTY_EMBED)
             return True
         
-        # Get user's actual Pokemon collection for validation
-        user_pokemon = self.mongo_db.get_pokemon_by_owner(user_id)
-        valid_pokemon_ids = {pokemon.get('id') for pokemon in user_pokemon}
-        
-        # Map party slots
-        slot_map = {
-            1: "first_pokemon",
-            2: "second_pokemon",
-            3: "third_pokemon", 
-            4: "fourth_pokemon",
-            5: "fifth_pokemon",
-            6: "sixth_pokemon"
-        }
-        
-        # Check for orphaned references and clean them up
-        cleaned_party = dict(party)
-        has_orphaned = False
-        
-        for slot_num, slot_field in slot_map.items():
-            pokemon_id = party.get(slot_field)
-            if pokemon_id and pokemon_id not in valid_pokemon_ids:
-                cleaned_party[slot_field] = None
-                has_orphaned = True
+        # Fetch only the party's Pokémon; IDs missing from the result are no longer owned
+        party_ids = [party[slot_field] for slot_field in _PARTY_SLOT_FIELDS.values() if party.get(slot_field)]
+        party_documents = await self.mongo_db.run_in_thread(
+            self.mongo_db.get_pokemon_by_owner_and_ids, user_id, party_ids, _PARTY_SHOW_PROJECTION
+        )
+        party_pokemon = {pokemon['id']: pokemon for pokemon in party_documents}
         
-        # If we found orphaned references, update the party and recurse
-        if has_orphaned:
-            self.mongo_db.create_or_update_party(user_id, cleaned_party)
-            # Recursively call this function to show the cleaned party
-            return await self.party_show_logic(unified_ctx)
+        # Check for orphaned references and clear just those slots
+        orphaned_fields = [
+            slot_field for slot_field in _PARTY_SLOT_FIELDS.values()
+            if party.get(slot_field) and party[slot_field] not in party_pokemon
+        ]
+        if orphaned_fields:
+            await self.mongo_db.run_in_thread(self.mongo_db.clear_party_slots, user_id, orphaned_fields)
+            party.update(dict.fromkeys(orphaned_fields))
         
         embed = discord.Embed(
-            title=f"📋 {unified_ctx.author.display_name}'s Pokémon Party",
+            title=f"📋 {author.display_name}'s Pokémon Party",
             description="Your current party lineup:",
             color=discord.Color.blue()
         )
         
-        embed.set_thumbnail(url=unified_ctx.author.display_avatar.url)
+        embed.set_thumbnail(url=author.display_avatar.url)
         
         party_count = 0
         
         for slot_num in range(1, 7):
-            slot_field = slot_map[slot_num]
+            slot_field = _PARTY_SLOT_FIELDS[slot_num]
             pokemon_id = party.get(slot_field)
             
             if pokemon_id:
                 # Get Pokémon details
-                pokemon_data = None
-                
-                for pokemon in user_pokemon:
-                    if pokemon.get('id') == pokemon_id:
-                        pokemon_data = pokemon
-                        break
+                pokemon_data = party_pokemon.get(pokemon_id)
                 
                 if pokemon_data:
                     party_count += 1
@@ -571,58 +551,31 @@ class CollectionPokemonCommands:
         
         # Validate index
         if not isinstance(index, int) or not (1 <= index <= 6):
-            embed = discord.Embed(
-                title="❌ Invalid Party Index",
-                description="Party index must be a number between 1 and 6.",
-                color=discord.Color.red()
-            )
-            await unified_ctx.send(embed=embed)
+            await unified_ctx.send(embed=_INVALID_PARTY_INDEX_EMBED)
             return False
         
         # Get current party
-        party = self.mongo_db.get_party(user_id)
+        party = await self.mongo_db.run_in_thread(self.mongo_db.get_party, user_id)
         if not party:
-            embed = discord.Embed(
-                title="❌ No Party Found",
-                description="You don't have a party yet! Use `!party_add` to add Pokémon first.",
-                color=discord.Color.red()
-            )
-            await unified_ctx.send(embed=embed)
+            await unified_ctx.send(embed=_NO_PARTY_FOUND_EMBED)
             return False
         
         # Check if slot has a Pokémon
-        slot_map = {
-            1: "first_pokemon",
-            2: "second_pokemon",
-            3: "third_pokemon", 
-            4: "fourth_pokemon",
-            5: "fifth_pokemon",
-            6: "sixth_pokemon"
-        }
-        
-        slot_field = slot_map[index]
+        slot_field = _PARTY_SLOT_FIELDS[index]
         pokemon_id = party.get(slot_field)
         
         if not pokemon_id:
-            embed = discord.Embed(
-                title="❌ Slot Already Empty",
-                description=f"Party slot {index} is already empty!",
-                color=discord.Color.red()
-            )
+            embed = _SLOT_ALREADY_EMPTY_TEMPLATE.copy()
+            embed.description = f"Party slot {index} is already empty!"
             await unified_ctx.send(embed=embed)
             return False
         
-        # Get Pokémon details for confirmation
-        user_pokemon = self.mongo_db.get_pokemon_by_owner(user_id)
-        pokemon_data = None
-        
-        for pokemon in user_pokemon:
-            if pokemon.get('id') == pokemon_id:
-                pokemon_data = pokemon
-                break
+        # Get Pokémon details for confirmation with an indexed point read
+        owned = await self.mongo_db.run_in_thread(self.mongo_db.get_pokemon_by_owner_and_ids, user_id, [pokemon_id], _PARTY_SLOT_PROJECTION)
+        pokemon_data = owned[0] if owned else None
         
         # Remove Pokémon from party
-        success = self.mongo_db.remove_pokemon_from_party(user_id, index)
+        success = await self.mongo_db.run_in_thread(self.mongo_db.remove_pokemon_from_party, user_id, index)
         
         if success:
             pokemon_name = pokemon_data['name'] if pokemon_data else f"Pokemon #{pokemon_id}"
@@ -638,12 +591,7 @@ class CollectionPokemonCommands:
             await unified_ctx.send(embed=embed)
             return True
         else:
-            embed = discord.Embed(
-                title="❌ Failed to Remove Pokémon",
-                description="An error occurred while removing the Pokémon from your party.",
-                color=discord.Color.red()
-            )
-            await unified_ctx.send(embed=embed)
+            await unified_ctx.send(embed=_PARTY_REMOVE_FAILED_EMBED)
             return False
     
     async def party_remove(self, ctx, index: int):
@@ -3,19 +3,78 @@ Leaderboard commands for Pokémon system.
 Handles different types of leaderboards with shared logic for both prefix and slash commands.
 """
 
-from typing import List, Tuple
+import asyncio
+import heapq
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 import discord
 
 from config import Config
-from ..models import CaughtPokemon
+from ..models.pokemon_model import PokemonStats
 from ..utils.interaction_utils import create_unified_context
 from ..utils.mongo_manager import MongoManager
 
+# Leaderboard type -> (column in _compute_all_scores results, metric label)
+_SCORE_COLUMNS = {
+    "pokemon_count": (0, "Pokemon"),
+    "total_power": (1, "Power"),
+    "rarity_score": (2, "Rarity Score")
+}
+
+# Rarity score per rarity, keyed by both the lowercase and stored (title case) spelling
+_RARITY_SCORES = {
+    label: points
+    for rarity, points in {
+        "mythical": 150,
+        "legendary": 100,
+        "ultra rare": 75,
+        "rare": 50,
+        "uncommon": 25,
+        "common": 0
+    }.items()
+    for label in (rarity, rarity.title())
+}
+
+# Embed colours and individual rank embed titles, built once
+_GOLD = discord.Color.gold()
+_BLUE = discord.Color.blue()
+_RANK_EMBED_TITLES = {
+    "pokemon_count": "📊 Pokemon Collection",
+    "total_power": "📊 Total Power",
+    "rarity_score": "📊 Rarity Score"
+}
+
+# Field name and metric label for each rank_all field, in _compute_all_scores column order
+_RANK_ALL_FIELDS = (
+    ("🏆 Pokemon Collection", "Pokemon"),
+    ("⚡ Total Power", "Power"),
+    ("💎 Rarity Score", "Score")
+)
+
+# Only the Pokémon fields leaderboard scoring reads
+_LEADERBOARD_PROJECTION = {"_id": 0, "owner_id": 1, "id": 1, "name": 1, "rarity": 1, "stats": 1}
+
+# Medals for the top three ranks and their rank displays
+_MEDALS = ("🥇", "🥈", "🥉")
+_MEDAL_RANK_DISPLAYS = tuple(f"{medal} #{rank}" for rank, medal in enumerate(_MEDALS, 1))
+
+# Position labels for the top 10 leaderboard lines
+_TOP_10_POSITIONS = _MEDALS + tuple(f"**{rank}.**" for rank in range(len(_MEDALS) + 1, 11))
+
+# Bonus rarity score for Pokémon with pseudo-legendary base stat totals
+_PSEUDO_LEGENDARY_TOTAL = 600
+_PSEUDO_LEGENDARY_BONUS = 25
+
 
 class LeaderboardCommands:
     """Handles all leaderboard-related commands with shared logic"""
 
+    # Seconds a resolved username is reused before asking Discord again
+    USERNAME_CACHE_TTL = 15 * 60
+    USERNAME_CACHE_MAX_SIZE = 10000
+
     def __init__(self, bot, mongo_db: MongoManager):
         self.bot = bot
         self.mongo_db = mongo_db
@@ -23,15 +82,22 @@ class LeaderboardCommands:
         # Setup logger using Config
         self.logger = Config.setup_logging()
 
-        # Username cache to avoid repeated API calls
-        self._username_cache = {}
-        self._cache_max_size = 1000  # Limit cache size
+        # user_id -> (expires_at, username), least recently used first, to avoid repeated API calls
+        self._username_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+        # (MongoDB cache generation, players) from the last grouped Pokémon load
+        self._players_cache: Optional[Tuple[int, List[Tuple[str, List[Dict[str, Any]]]]]] = None
+
+        # user_id -> ((Pokémon count, highest collection ID), scores) from the last scoring pass
+        self._player_scores: Dict[str, Tuple[Tuple[int, int], Tuple[int, int, int]]] = {}
 
     async def _get_username(self, user_id: str) -> str:
         """Get username for a user ID with caching and optimized resolution"""
         # Check cache first
-        if user_id in self._username_cache:
-            return self._username_cache[user_id]
+        cached = self._username_cache.get(user_id)
+        if cached is not None and cached[0] > time.monotonic():
+            self._username_cache.move_to_end(user_id)
+            return cached[1]
 
         try:
             user_id_int = int(user_id)
@@ -67,167 +133,174 @@ class LeaderboardCommands:
             if not username:
                 username = f"Unknown User"
 
-            # Cache the result (with size limit)
-            if len(self._username_cache) >= self._cache_max_size:
-                # Remove the oldest entry (simple FIFO)
-                oldest_key = next(iter(self._username_cache))
-                del self._username_cache[oldest_key]
-
-            self._username_cache[user_id] = username
+            self._cache_username(user_id, username)
             return username
 
         except ValueError:
             self.logger.error(f"Invalid user ID format: {user_id}")
             username = f"Invalid User"
-            self._username_cache[user_id] = username
+            self._cache_username(user_id, username)
             return username
         except Exception as e:
             self.logger.error(f"Error resolving username for {user_id}: {e}")
             username = f"Unknown User"
-            self._username_cache[user_id] = username
+            self._cache_username(user_id, username)
             return username
 
+    def _cache_username(self, user_id: str, username: str):
+        """Remember a resolved username, evicting the least recently used beyond the size limit"""
+        self._username_cache[user_id] = (time.monotonic() + self.USERNAME_CACHE_TTL, username)
+        self._username_cache.move_to_end(user_id)
+        if len(self._username_cache) > self.USERNAME_CACHE_MAX_SIZE:
+            self._username_cache.popitem(last=False)
+
     def clear_username_cache(self):
         """Clear the username cache (useful for testing or memory management)"""
         self._username_cache.clear()
         self.logger.info("Username cache cleared")
 
-    @staticmethod
-    def _calculate_pokemon_count(pokemons: List[CaughtPokemon]) -> int:
-        """Calculate unique Pokémon species count for a player"""
-        pokemon_names = set()
-        for pokemon in pokemons:
-            pokemon_names.add(pokemon.name)
-        return len(pokemon_names)
+    def _load_players(self) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Load every player's Pokémon scoring fields, reusing the last load until MongoDB is written to"""
+        # Read the generation first so a write during the load leaves the result stale
+        generation = self.mongo_db.cache_generation
+        if self._players_cache is not None and self._players_cache[0] == generation:
+            return self._players_cache[1]
+
+        players = [
+            (player.get("_id"), player.get("pokemons"))
+            for player in self.mongo_db.get_pokemon_grouped_by_owner(_LEADERBOARD_PROJECTION)
+        ]
+        self._players_cache = (generation, players)
+        return players
 
     @staticmethod
-    def _calculate_total_power(pokemons: List[CaughtPokemon]) -> int:
-        """Calculate total power level of all Pokémon for a player"""
-        total_power = 0
-        for pokemon in pokemons:
-            total_power += pokemon.stats.total
-        return total_power
+    def _calculate_rarity_points(rarity: str, total_stats: int) -> int:
+        """Calculate the rarity score a single Pokémon contributes"""
+        # Stored rarities are title case, so lowercasing is only needed for unusual spellings
+        points = _RARITY_SCORES.get(rarity)
+        if points is None:
+            points = _RARITY_SCORES.get(rarity.lower(), 0)
+
+        # Additional points for high base stats (pseudo-legendary check)
+        if total_stats >= _PSEUDO_LEGENDARY_TOTAL:
+            points += _PSEUDO_LEGENDARY_BONUS
+        return points
+
+    def _compute_all_scores(self, players: List[Tuple[str, List[Dict[str, Any]]]]) -> Dict[str, Tuple[int, int, int]]:
+        """Calculate every player's Pokémon count, total power and rarity score in one pass"""
+        all_scores = {}
+        player_scores = {}
+        for user_id, pokemons in players:
+            # Collections only change by catching (new highest ID) or releasing (fewer Pokémon)
+            fingerprint = (len(pokemons), max((pokemon.get("id", 0) for pokemon in pokemons), default=0))
+            cached = self._player_scores.get(user_id)
+            if cached is not None and cached[0] == fingerprint:
+                scores = cached[1]
+            else:
+                try:
+                    pokemon_names = set()
+                    total_power = 0
+                    rarity_score = 0
+                    for pokemon in pokemons:
+                        stats = pokemon["stats"]
+                        total_stats = stats.get("total")
+                        if total_stats is None:
+                            total_stats = PokemonStats(stats).total
+                        pokemon_names.add(pokemon["name"])
+                        total_power += total_stats
+                        rarity_score += self._calculate_rarity_points(pokemon["rarity"], total_stats)
+                    scores = (len(pokemon_names), total_power, rarity_score)
+                except Exception as e:
+                    self.logger.error(f"Error calculating score for user {user_id}: {e}")
+                    continue
+            all_scores[user_id] = scores
+            player_scores[user_id] = (fingerprint, scores)
+
+        # Only keep players still in the database
+        self._player_scores = player_scores
+        return all_scores
+
+    def _load_scores(self) -> Dict[str, Tuple[int, int, int]]:
+        """Load and score every player; blocking, so callers run it with run_in_thread"""
+        return self._compute_all_scores(self._load_players())
 
     @staticmethod
-    def _calculate_rarity_score(pokemons: List[CaughtPokemon]) -> int:
-        """Calculate rarity score based on legendary and rare Pokémon"""
-        rarity_score = 0
-        for pokemon in pokemons:
-            # Use rarity directly from the player's Pokémon data
-            rarity = pokemon.rarity.lower()
-
-            # Score based on rarity field
-            if rarity == 'legendary':
-                rarity_score += 100
-            elif rarity == 'mythical':
-                rarity_score += 150
-            elif rarity == 'ultra rare':
-                rarity_score += 75
-            elif rarity == 'rare':
-                rarity_score += 50
-            elif rarity == 'uncommon':
-                rarity_score += 25
-            # Common gets 0 points
-
-            # Additional points for high base stats (pseudo-legendary check)
-            total_stats = pokemon.stats.total
-            if total_stats >= 600:
-                rarity_score += 25  # Bonus for pseudo-legendary stats
-        return rarity_score
+    def _rank_from_scores(all_scores: Dict[str, Tuple[int, int, int]], user_id: str, index: int) -> Tuple[int, int]:
+        """Get a user's rank and score for one column of _compute_all_scores (0 rank if unranked)"""
+        user_scores = all_scores.get(user_id)
+        if user_scores is None:
+            return 0, 0
+
+        # Rank by counting who places ahead; ties go to whoever was loaded first
+        user_score = user_scores[index]
+        user_rank = 1
+        before_user = True
+        for uid, scores in all_scores.items():
+            if uid == user_id:
+                before_user = False
+                continue
+            if scores[index] > user_score or (before_user and scores[index] == user_score):
+                user_rank += 1
+        return user_rank, user_score
 
     async def _get_leaderboard_data(self, leaderboard_type: str) -> List[Tuple[str, int, str]]:
         """Get leaderboard data for specified type with optimized processing"""
-        players = self.mongo_db.get_pokemon_grouped_by_owner()
-
-        self.logger.info(f"Processing {len(players)} players for {leaderboard_type} leaderboard")
-
-        # Step 1: Calculate scores for all players (fast, no async)
-        scores = []
-        for player in players:
-            caught_pokemon = list(CaughtPokemon.from_dict(p) for p in player.get("pokemons"))
-            user_id = player.get("_id")
-            try:
-                if leaderboard_type == "pokemon_count":
-                    score = self._calculate_pokemon_count(caught_pokemon)
-                    metric = "Pokemon"
-                elif leaderboard_type == "total_power":
-                    score = self._calculate_total_power(caught_pokemon)
-                    metric = "Power"
-                elif leaderboard_type == "rarity_score":
-                    score = self._calculate_rarity_score(caught_pokemon)
-                    metric = "Rarity Score"
-                else:
-                    continue
+        if leaderboard_type not in _SCORE_COLUMNS:
+            return []
+        column, metric = _SCORE_COLUMNS[leaderboard_type]
+        all_scores = await self.mongo_db.run_in_thread(self._load_scores)
 
-                if score > 0:  # Only include players with actual data
-                    scores.append((user_id, score, metric))
+        self.logger.info(f"Processing {len(all_scores)} players for {leaderboard_type} leaderboard")
 
-            except Exception as e:
-                self.logger.error(f"Error calculating score for user {user_id}: {e}")
-                continue
+        # Step 1: Pick each player's score for this leaderboard (fast, no async)
+        scores = [
+            (user_id, player_scores[column], metric)
+            for user_id, player_scores in all_scores.items()
+            if player_scores[column] > 0  # Only include players with actual data
+        ]
 
-        # Step 2: Sort and get top 10 (fast)
-        scores.sort(key=lambda x: x[1], reverse=True)
-        top_scores = scores[:10]
+        # Step 2: Get top 10 without sorting everyone (nlargest keeps ties in load order)
+        top_scores = heapq.nlargest(10, scores, key=lambda x: x[1])
 
         self.logger.info(f"Found {len(scores)} players with {leaderboard_type} > 0, processing top {len(top_scores)}")
 
-        # Step 3: Only get usernames for top 10 players (much fewer async calls)
-        leaderboard = []
-        for user_id, score, metric in top_scores:
-            try:
-                username = await self._get_username(user_id)
-                leaderboard.append((username, score, metric))
-
-                # Log scores for debugging
-                if leaderboard_type == "total_power":
-                    self.logger.debug(f"Top player {username} ({user_id[-4:]}): Power = {score}")
+        # Step 3: Only get usernames for top 10 players, resolving them concurrently
+        usernames = await asyncio.gather(
+            *(self._get_username(user_id) for user_id, _, _ in top_scores),
+            return_exceptions=True
+        )
 
-            except Exception as e:
-                self.logger.error(f"Error getting username for top player {user_id}: {e}")
+        leaderboard = []
+        for (user_id, score, metric), username in zip(top_scores, usernames):
+            if isinstance(username, Exception):
+                self.logger.error(f"Error getting username for top player {user_id}: {username}")
                 # Still include in leaderboard with fallback name
                 leaderboard.append((f"Player #{user_id[-4:]}", score, metric))
+                continue
 
-        return leaderboard
-
-    def _get_user_rank(self, user_id: str, leaderboard_type: str) -> Tuple[int, int, str]:
-        """Get individual user's rank in specified leaderboard"""
-        players = self.mongo_db.get_pokemon_grouped_by_owner()
-        all_scores = []
-
-        for player in players:
-            caught_pokemon = list(CaughtPokemon.from_dict(p) for p in player.get("pokemons"))
-            if leaderboard_type == "pokemon_count":
-                score = self._calculate_pokemon_count(caught_pokemon)
-            elif leaderboard_type == "total_power":
-                score = self._calculate_total_power(caught_pokemon)
-            elif leaderboard_type == "rarity_score":
-                score = self._calculate_rarity_score(caught_pokemon)
-            else:
-                return 0, 0, "Unknown"
-
-            all_scores.append((player.get("_id"), score))
+            leaderboard.append((username, score, metric))
 
-        # Sort by score (descending)
-        all_scores.sort(key=lambda x: x[1], reverse=True)
+            # Log scores for debugging
+            if leaderboard_type == "total_power":
+                self.logger.debug(f"Top player {username} ({user_id[-4:]}): Power = {score}")
 
-        # Find user's position
-        user_score = 0
-        user_rank = 0
-        metric = {
-            "pokemon_count": "Pokemon",
-            "total_power": "Power",
-            "rarity_score": "Rarity Score"
-        }.get(leaderboard_type, "Score")
+        return leaderboard
 
-        for i, (uid, score) in enumerate(all_scores):
-            if uid == user_id:
-                user_rank = i + 1
-                user_score = score
-                break
+    async def _get_user_rank(self, user_id: str, leaderboard_type: str) -> Tuple[int, int, str]:
+        """Get individual user's rank in specified leaderboard"""
+        if leaderboard_type not in _SCORE_COLUMNS:
+            return 0, 0, "Unknown"
+        column, metric = _SCORE_COLUMNS[leaderboard_type]
 
+        all_scores = await self.mongo_db.run_in_thread(self._load_scores)
+        user_rank, user_score = self._rank_from_scores(all_scores, user_id, column)
         return user_rank, user_score, metric
 
+    @staticmethod
+    def _format_rank(rank: int) -> str:
+        """Format a 1-based rank, with a medal for the top three"""
+        return _MEDAL_RANK_DISPLAYS[rank - 1] if 1 <= rank <= len(_MEDAL_RANK_DISPLAYS) else f"#{rank}"
+
     @staticmethod
     def _create_leaderboard_embed(leaderboard_data: List[Tuple[str, int, str]],
                                   title: str, description: str) -> discord.Embed:
@@ -235,7 +308,7 @@ class LeaderboardCommands:
         embed = discord.Embed(
             title=f"🏆 {title}",
             description=description,
-            color=discord.Color.gold()
+            color=_GOLD
         )
 
         if not leaderboard_data:
@@ -247,16 +320,10 @@ class LeaderboardCommands:
             return embed
 
         # Add rankings
-        leaderboard_text = ""
-        medals = ["🥇", "🥈", "🥉"]
-
-        for i, (username, score, metric) in enumerate(leaderboard_data):
-            if i < 3:
-                medal = medals[i]
-            else:
-                medal = f"**{i + 1}.**"
-
-            leaderboard_text += f"{medal} **{username}** - {score:,} {metric}\n"
+        leaderboard_text = "".join(
+            f"{position} **{username}** - {score:,} {metric}\n"
+            for position, (username, score, metric) in zip(_TOP_10_POSITIONS, leaderboard_data)
+        )
 
         embed.add_field(
             name="Top 10 Rankings",
@@ -267,19 +334,13 @@ class LeaderboardCommands:
         embed.set_footer(text="Use leaderboard rank @user to check individual rankings!")
         return embed
 
-    @staticmethod
-    def _create_rank_embed(user: discord.Member, rank: int, score: int,
+    @classmethod
+    def _create_rank_embed(cls, user: discord.Member, rank: int, score: int,
                            metric: str, leaderboard_type: str) -> discord.Embed:
         """Create embed for individual rank display"""
-        type_names = {
-            "pokemon_count": "Pokemon Collection",
-            "total_power": "Total Power",
-            "rarity_score": "Rarity Score"
-        }
-
         embed = discord.Embed(
-            title=f"📊 {type_names.get(leaderboard_type, 'Ranking')}",
-            color=discord.Color.blue()
+            title=_RANK_EMBED_TITLES.get(leaderboard_type, "📊 Ranking"),
+            color=_BLUE
         )
 
         if rank == 0:
@@ -290,14 +351,7 @@ class LeaderboardCommands:
             )
         else:
             # Add rank emoji based on position
-            if rank == 1:
-                rank_display = "🥇 #1"
-            elif rank == 2:
-                rank_display = "🥈 #2"
-            elif rank == 3:
-                rank_display = "🥉 #3"
-            else:
-                rank_display = f"#{rank}"
+            rank_display = cls._format_rank(rank)
 
             embed.add_field(
                 name=f"{user.display_name}'s Ranking",
@@ -340,7 +394,7 @@ class LeaderboardCommands:
 
     async def _leaderboard_rank_logic(self, unified_ctx, leaderboard_type: str, target_user: discord.Member):
         """Shared logic for individual rank lookup"""
-        rank, score, metric = self._get_user_rank(str(target_user.id), leaderboard_type)
+        rank, score, metric = await self._get_user_rank(str(target_user.id), leaderboard_type)
         embed = self._create_rank_embed(target_user, rank, score, metric, leaderboard_type)
         await unified_ctx.send(embed=embed)
 
@@ -377,86 +431,25 @@ class LeaderboardCommands:
     # Shared logic for showing all ranks
     async def leaderboard_rank_all_logic(self, unified_ctx, target_user: discord.Member):
         """Shared logic for showing all ranks at once"""
-        # Get ranks for all leaderboard types
-        pokemon_rank, pokemon_score, _ = self._get_user_rank(str(target_user.id), "pokemon_count")
-        power_rank, power_score, _ = self._get_user_rank(str(target_user.id), "total_power")
-        rarity_rank, rarity_score, _ = self._get_user_rank(str(target_user.id), "rarity_score")
+        # Get ranks for all leaderboard types from a single scoring pass
+        user_id = str(target_user.id)
+        all_scores = await self.mongo_db.run_in_thread(self._load_scores)
 
         # Create comprehensive rank embed
         embed = discord.Embed(
             title=f"📊 {target_user.display_name}'s Rankings",
             description="Complete ranking across all leaderboards",
-            color=discord.Color.blue()
+            color=_BLUE
         )
 
-        # Pokémon Collection Ranking
-        if pokemon_rank > 0:
-            if pokemon_rank == 1:
-                rank_display = "🥇 #1"
-            elif pokemon_rank == 2:
-                rank_display = "🥈 #2"
-            elif pokemon_rank == 3:
-                rank_display = "🥉 #3"
-            else:
-                rank_display = f"#{pokemon_rank}"
-
-            embed.add_field(
-                name="🏆 Pokemon Collection",
-                value=f"**Rank:** {rank_display}\n**Pokemon:** {pokemon_score:,}",
-                inline=True
-            )
-        else:
-            embed.add_field(
-                name="🏆 Pokemon Collection",
-                value="**Rank:** Not ranked\n**Pokemon:** 0",
-                inline=True
-            )
-
-        # Total Power Ranking
-        if power_rank > 0:
-            if power_rank == 1:
-                rank_display = "🥇 #1"
-            elif power_rank == 2:
-                rank_display = "🥈 #2"
-            elif power_rank == 3:
-                rank_display = "🥉 #3"
+        # One field per leaderboard, in _compute_all_scores column order
+        for column, (field_name, metric) in enumerate(_RANK_ALL_FIELDS):
+            rank, score = self._rank_from_scores(all_scores, user_id, column)
+            if rank > 0:
+                value = f"**Rank:** {self._format_rank(rank)}\n**{metric}:** {score:,}"
             else:
-                rank_display = f"#{power_rank}"
-
-            embed.add_field(
-                name="⚡ Total Power",
-                value=f"**Rank:** {rank_display}\n**Power:** {power_score:,}",
-                inline=True
-            )
-        else:
-            embed.add_field(
-                name="⚡ Total Power",
-                value="**Rank:** Not ranked\n**Power:** 0",
-                inline=True
-            )
-
-        # Rarity Score Ranking
-        if rarity_rank > 0:
-            if rarity_rank == 1:
-                rank_display = "🥇 #1"
-            elif rarity_rank == 2:
-                rank_display = "🥈 #2"
-            elif rarity_rank == 3:
-                rank_display = "🥉 #3"
-            else:
-                rank_display = f"#{rarity_rank}"
-
-            embed.add_field(
-                name="💎 Rarity Score",
-                value=f"**Rank:** {rank_display}\n**Score:** {rarity_score:,}",
-                inline=True
-            )
-        else:
-            embed.add_field(
-                name="💎 Rarity Score",
-                value="**Rank:** Not ranked\n**Score:** 0",
-                inline=True
-            )
+                value = f"**Rank:** Not ranked\n**{metric}:** 0"
+            embed.add_field(name=field_name, value=value, inline=True)
 
         embed.set_footer(text="Use specific leaderboard commands to see top 10 rankings!")
         await unified_ctx.send(embed=embed)
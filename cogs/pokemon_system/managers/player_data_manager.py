@@ -3,19 +3,48 @@ Player Data Manager
 Handles loading, saving, and managing player data operations.
 """
 
+import asyncio
 import json
 import os
-from typing import Dict, List, Optional
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Tuple
 from ..models.player_model import PlayerData
 
+# orjson parses and writes the player file several times faster; fall back to json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class PlayerDataManager:
     """Manages player data operations"""
     
+    # Maximum number of users whose owned Pokémon counts are kept in memory
+    OWNED_COUNTS_MAX_USERS = 10000
+    
     def __init__(self, data_file: str = "pokemon_data.json", mongo_db=None):
         self.data_file = data_file
         self.players: Dict[str, PlayerData] = {}
         self.mongo_db = mongo_db
+        
+        # Pending save shared by every caller that asked while the previous write was running
+        self._pending_save: Optional[asyncio.Future] = None
+        self._save_task: Optional[asyncio.Task] = None
+        
+        # Coalesced saves write from a worker thread, so file writes are serialized
+        self._file_lock = threading.Lock()
+        self._snapshot_sequence = 0
+        self._written_sequence = 0
+        
+        # LRU cache of owned Pokémon counts by name, per user
+        self.owned_counts: "OrderedDict[str, Counter]" = OrderedDict()
+        # Catches being stored per user, and a token per user whose counts are loading.
+        # A catch starting or finishing drops the token, so a load that may or may not
+        # have seen the new Pokémon isn't cached
+        self._catches_in_flight: Counter = Counter()
+        self._owned_counts_loads: Dict[str, object] = {}
         self.load_all_player_data()
     
     def load_all_player_data(self) -> bool:
@@ -25,8 +54,9 @@ class PlayerDataManager:
                 print(f"Player data file {self.data_file} not found, starting fresh")
                 return True
             
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                raw_json = f.read()
+            raw_data = orjson.loads(raw_json) if orjson else json.loads(raw_json)
             
             # Convert raw data to PlayerData objects
             self.players = {}
@@ -46,13 +76,32 @@ class PlayerDataManager:
     def save_all_player_data(self) -> bool:
         """Save all player data to JSON file"""
         try:
-            # Convert PlayerData objects to dictionaries
-            raw_data = {}
-            for user_id, player_data in self.players.items():
-                raw_data[user_id] = player_data.to_dict()
-            
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(raw_data, f, indent=2)
+            return self._write_player_data(*self._player_data_snapshot())
+        except Exception as e:
+            print(f"Error saving player data: {e}")
+            return False
+    
+    def _player_data_snapshot(self) -> Tuple[Dict[str, dict], int]:
+        """Convert PlayerData objects to dictionaries, numbered so older snapshots can't overwrite newer ones"""
+        self._snapshot_sequence += 1
+        raw_data = {user_id: player_data.to_dict() for user_id, player_data in self.players.items()}
+        return raw_data, self._snapshot_sequence
+    
+    def _write_player_data(self, raw_data: Dict[str, dict], sequence: int) -> bool:
+        """Write converted player data to the JSON file; safe to call from a worker thread"""
+        try:
+            with self._file_lock:
+                # A newer snapshot already on disk includes everything this one holds
+                if sequence < self._written_sequence:
+                    return True
+                
+                if orjson:
+                    with open(self.data_file, 'wb') as f:
+                        f.write(orjson.dumps(raw_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    with open(self.data_file, 'w', encoding='utf-8') as f:
+                        json.dump(raw_data, f, indent=2)
+                self._written_sequence = sequence
             
             return True
             
@@ -62,11 +111,22 @@ class PlayerDataManager:
     
     def get_player(self, user_id: str) -> PlayerData:
         """Get player data, creating new player if doesn't exist"""
-        if user_id not in self.players:
-            self.players[user_id] = PlayerData(user_id, mongo_db=self.mongo_db)
-            self.save_all_player_data()  # Save immediately when creating new player
+        player = self.players.get(user_id)
+        if player is None:
+            player = self.players[user_id] = PlayerData(user_id, mongo_db=self.mongo_db)
+            # Persist new players with the next coalesced write when running in the bot's loop
+            try:
+                self.save_player_batched(user_id).add_done_callback(self._report_new_player_save)
+            except RuntimeError:
+                self.save_all_player_data()
         
-        return self.players[user_id]
+        return player
+    
+    @staticmethod
+    def _report_new_player_save(future: asyncio.Future):
+        """Log a failed coalesced save of a newly created player"""
+        if not future.result():
+            print("Error saving new player data; it will be written with the next save")
     
     def player_exists(self, user_id: str) -> bool:
         """Check if player exists in the system"""
@@ -83,6 +143,82 @@ class PlayerDataManager:
         
         return self.save_all_player_data()
     
+    def save_player_batched(self, user_id: str) -> asyncio.Future:
+        """
+        Save specific player's data with the next coalesced write.
+        Returns a future resolving to the save result.
+        """
+        loop = asyncio.get_running_loop()
+        if user_id not in self.players:
+            future = loop.create_future()
+            future.set_result(False)
+            return future
+        
+        if self._pending_save is None:
+            self._pending_save = loop.create_future()
+            if self._save_task is None or self._save_task.done():
+                self._save_task = loop.create_task(self._flush_pending_save())
+        return self._pending_save
+    
+    async def _flush_pending_save(self):
+        """Write all player data, once more for every batch of saves requested during a write"""
+        while self._pending_save is not None:
+            future, self._pending_save = self._pending_save, None
+            
+            # Convert on the loop so players aren't read mid-update; encode and write in a thread
+            try:
+                result = await asyncio.to_thread(self._write_player_data, *self._player_data_snapshot())
+            except Exception as e:
+                print(f"Error saving player data: {e}")
+                result = False
+            if not future.done():
+                future.set_result(result)
+    
+    async def get_owned_counts(self, user_id: str) -> Counter:
+        """Get how many of each Pokémon a player owns, loading from MongoDB on first access"""
+        counts = self.owned_counts.get(user_id)
+        if counts is not None:
+            self.owned_counts.move_to_end(user_id)
+            return counts
+        
+        if not self.mongo_db:
+            return Counter()
+        
+        load_token = self._owned_counts_loads[user_id] = object()
+        try:
+            counts = Counter(await self.mongo_db.run_in_thread(self.mongo_db.get_pokemon_name_counts, user_id))
+        finally:
+            still_current = self._owned_counts_loads.get(user_id) is load_token
+            if still_current:
+                del self._owned_counts_loads[user_id]
+        
+        if still_current and not self._catches_in_flight[user_id]:
+            self.owned_counts[user_id] = counts
+            if len(self.owned_counts) > self.OWNED_COUNTS_MAX_USERS:
+                self.owned_counts.popitem(last=False)
+        return counts
+    
+    def begin_catch(self, user_id: str):
+        """Note that a caught Pokémon is being stored for a user; pair with record_caught_pokemon"""
+        self._catches_in_flight[user_id] += 1
+        self._owned_counts_loads.pop(user_id, None)
+    
+    def record_caught_pokemon(self, user_id: str, pokemon_name: str, stored: bool = True):
+        """Finish a catch started with begin_catch, counting the Pokémon if it was stored"""
+        self._catches_in_flight[user_id] -= 1
+        if self._catches_in_flight[user_id] <= 0:
+            del self._catches_in_flight[user_id]
+        self._owned_counts_loads.pop(user_id, None)
+        
+        # Cached counts were loaded before the catch started, so they don't include it yet
+        counts = self.owned_counts.get(user_id)
+        if counts is not None:
+            if stored:
+                counts[pokemon_name] += 1
+            else:
+                # The store may have partly succeeded; reload on next access
+                del self.owned_counts[user_id]
+    
     def delete_player(self, user_id: str) -> bool:
         """Delete a player's data"""
         if user_id in self.players:
@@ -146,9 +282,10 @@ class PlayerDataManager:
         rarity_counts = {"Common": 0, "Uncommon": 0, "Rare": 0, "Legendary": 0}
         
         for player in self.players.values():
-            for pokemon in player.pokemon_collection:
-                if pokemon.rarity in rarity_counts:
-                    rarity_counts[pokemon.rarity] += 1
+            # Each player's rarity Counter is kept up to date incrementally
+            player_counts = player.get_rarity_counts()
+            for rarity in rarity_counts:
+                rarity_counts[rarity] += player_counts[rarity]
         
         return rarity_counts
     
@@ -9,6 +9,12 @@ import random
 from typing import Dict, List, Optional, Tuple
 from ..models.pokemon_model import PokemonData
 
+# orjson parses the master database several times faster; fall back to json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class PokemonDatabaseManager:
     """Manages the Pokemon master database operations"""
@@ -16,6 +22,8 @@ class PokemonDatabaseManager:
     def __init__(self, database_file: str = "pokemon_master_database.json"):
         self.database_file = database_file
         self.pokemon_database: Dict[int, PokemonData] = {}
+        # Lowercase name -> Pokemon, for exact case-insensitive lookups
+        self.pokemon_by_name: Dict[str, PokemonData] = {}
         self.load_database()
     
     def load_database(self) -> bool:
@@ -25,14 +33,19 @@ class PokemonDatabaseManager:
                 print(f"Pokemon database file {self.database_file} not found!")
                 return False
             
-            with open(self.database_file, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
+            with open(self.database_file, 'rb') as f:
+                raw_json = f.read()
+            raw_data = orjson.loads(raw_json) if orjson else json.loads(raw_json)
             
             # Convert raw data to PokemonData objects
             self.pokemon_database = {}
+            self.pokemon_by_name = {}
             for pokemon_id_str, pokemon_data in raw_data.items():
                 pokemon_id = int(pokemon_id_str)
-                self.pokemon_database[pokemon_id] = PokemonData(pokemon_id, pokemon_data)
+                pokemon = PokemonData(pokemon_id, pokemon_data)
+                self.pokemon_database[pokemon_id] = pokemon
+                # Keep the first Pokemon for a name, as a front-to-back scan would
+                self.pokemon_by_name.setdefault(pokemon.name.lower(), pokemon)
             
             print(f"Loaded {len(self.pokemon_database)} Pokemon from database")
             return True
@@ -53,15 +66,13 @@ class PokemonDatabaseManager:
     
     def get_pokemon_by_name(self, name: str) -> Optional[PokemonData]:
         """Get Pokemon data by name (case-insensitive)"""
-        for pokemon in self.pokemon_database.values():
-            if pokemon.name.lower() == name.lower():
-                return pokemon
-        return None
+        return self.pokemon_by_name.get(name.lower())
     
     def get_pokemon_by_rarity(self, rarity: str) -> List[PokemonData]:
         """Get all Pokemon of a specific rarity"""
+        rarity = rarity.lower()
         return [pokemon for pokemon in self.pokemon_database.values() 
-                if pokemon.rarity.lower() == rarity.lower()]
+                if pokemon.rarity.lower() == rarity]
     
     def get_pokemon_by_generation(self, generation: int) -> List[PokemonData]:
         """Get all Pokemon from a specific generation"""
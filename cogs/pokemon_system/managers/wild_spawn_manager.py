@@ -208,8 +208,9 @@ class WildSpawnManager:
                 return channel
             else:
                 # Try case-insensitive search
+                target_name_lower = target_channel_name.lower()
                 for ch in guild.text_channels:
-                    if ch.name.lower() == target_channel_name.lower():
+                    if ch.name.lower() == target_name_lower:
                         print(f"Found channel with case-insensitive match: {ch.name} (ID: {ch.id})")
                         return ch
         
@@ -4,12 +4,13 @@ Contains data structures for Pokemon and Player entities.
 """
 
 from .pokemon_model import PokemonData, CaughtPokemon
-from .player_model import PlayerData, PlayerStats, PlayerInventory
+from .player_model import PlayerData, PlayerStats, PlayerInventory, BallEntry
 
 __all__ = [
     'PokemonData',
     'CaughtPokemon', 
     'PlayerData',
     'PlayerStats',
-    'PlayerInventory'
+    'PlayerInventory',
+    'BallEntry'
 ]
\ No newline at end of file
@@ -3,11 +3,20 @@ Player Data Models
 Defines data structures for player entities and their game data.
 """
 
-from typing import Dict, List, Optional, Any
+from collections import Counter
+from functools import cached_property
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from .pokemon_model import CaughtPokemon, PokemonData
 
 
+class BallEntry(NamedTuple):
+    """A ball type with its display name and the player's current count"""
+    type: str
+    name: str
+    count: int
+
+
 class PlayerInventory:
     """Manages player's pokeball inventory"""
     
@@ -51,6 +60,10 @@ class PlayerInventory:
         
         # Legacy support
         self.normal_pokeballs = self.poke_balls  # Backward compatibility
+        
+        # Rows from get_all_balls_cached and the counts they were built from
+        self._ball_rows: Tuple[BallEntry, ...] = ()
+        self._ball_rows_key: Optional[Tuple[int, ...]] = None
     
     def has_pokeball(self, ball_type: str) -> bool:
         """Check if player has pokeballs of specified type"""
@@ -116,7 +129,8 @@ class PlayerInventory:
             return self.master_balls
         return 0
     
-    def _normalize_ball_type(self, ball_type: str) -> str:
+    @staticmethod
+    def _normalize_ball_type(ball_type: str) -> str:
         """Normalize ball type names for backward compatibility"""
         ball_type = ball_type.lower().strip()
         
@@ -132,10 +146,11 @@ class PlayerInventory:
         
         return ball_type
     
-    def get_ball_info(self, ball_type: str) -> Dict[str, Any]:
+    @classmethod
+    def get_ball_info(cls, ball_type: str) -> Dict[str, Any]:
         """Get ball configuration info"""
-        ball_type = self._normalize_ball_type(ball_type)
-        return self.POKEBALL_CONFIG.get(ball_type, {})
+        ball_type = cls._normalize_ball_type(ball_type)
+        return cls.POKEBALL_CONFIG.get(ball_type, {})
     
     def get_all_balls(self) -> Dict[str, Dict[str, Any]]:
         """Get all ball types with their counts and info"""
@@ -147,6 +162,17 @@ class PlayerInventory:
             }
         return result
     
+    def get_all_balls_cached(self) -> Tuple[BallEntry, ...]:
+        """Get a BallEntry for every ball type, rebuilt only when counts change"""
+        counts = (self.poke_balls, self.great_balls, self.ultra_balls, self.master_balls)
+        if counts != self._ball_rows_key:
+            self._ball_rows = tuple(
+                BallEntry(ball_type, config["name"], self.get_pokeball_count(ball_type))
+                for ball_type, config in self.POKEBALL_CONFIG.items()
+            )
+            self._ball_rows_key = counts
+        return self._ball_rows
+    
     def to_dict(self) -> Dict[str, int]:
         """Convert inventory to dictionary format"""
         return {
@@ -169,6 +195,10 @@ class PlayerStats:
         self.total_caught = stats_data.get("total_caught", 0)
         self.total_encounters = stats_data.get("total_encounters", 0)
         self.join_date = stats_data.get("join_date", datetime.now().isoformat())
+        
+        # Formatted catch rate and the (caught, encounters) it was formatted from
+        self._catch_rate_display = ""
+        self._catch_rate_key: Optional[Tuple[int, int]] = None
     
     def add_encounter(self):
         """Record a new encounter"""
@@ -178,12 +208,26 @@ class PlayerStats:
         """Record a successful catch"""
         self.total_caught += 1
     
+    @cached_property
+    def join_date_display(self) -> str:
+        """Join date formatted for display, parsed once per stats object"""
+        return datetime.fromisoformat(self.join_date).strftime("%B %d, %Y")
+    
     def get_catch_rate(self) -> float:
         """Calculate player's catch rate percentage"""
         if self.total_encounters == 0:
             return 0.0
         return (self.total_caught / self.total_encounters) * 100
     
+    @property
+    def catch_rate_display(self) -> str:
+        """Catch rate formatted for display, reformatted only when the counts change"""
+        key = (self.total_caught, self.total_encounters)
+        if key != self._catch_rate_key:
+            self._catch_rate_display = f"{self.get_catch_rate():.1f}%"
+            self._catch_rate_key = key
+        return self._catch_rate_display
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert stats to dictionary format"""
         return {
@@ -203,7 +247,9 @@ class PlayerData:
         if data is None:
             data = self._get_default_data()
         
-        self.pokemon_collection: List[CaughtPokemon] = []
+        # Assigning the collection also resets its incremental rarity counts
+        self.pokemon_collection = []
+        
         self.inventory = PlayerInventory(data.get("pokeballs", {}))
         self.stats = PlayerStats(data.get("stats", {}))
         self.last_encounter = data.get("last_encounter")
@@ -608,6 +654,32 @@ class PlayerData:
         """Get Pokemon from collection by name"""
         return next((p for p in self.pokemon_collection if p.name.lower() == name.lower()), None)
     
+    @property
+    def pokemon_collection(self) -> List[CaughtPokemon]:
+        """The player's caught Pokemon"""
+        return self._pokemon_collection
+    
+    @pokemon_collection.setter
+    def pokemon_collection(self, collection: List[CaughtPokemon]):
+        self._pokemon_collection = collection
+        # Rarity counts over the first _rarity_counted Pokémon, extended as the collection grows
+        self._rarity_counted = 0
+        self._rarity_counts: Counter = Counter()
+    
+    def get_rarity_counts(self) -> Counter:
+        """Get how many Pokemon of each rarity the player owns"""
+        size = len(self.pokemon_collection)
+        if size < self._rarity_counted:
+            # The collection shrank, so start counting over
+            self._rarity_counted = 0
+            self._rarity_counts = Counter()
+        if size > self._rarity_counted:
+            # Catches only append, so just the new Pokémon need counting
+            self._rarity_counts.update(pokemon.rarity for pokemon in self.pokemon_collection[self._rarity_counted:])
+            self._rarity_counted = size
+        # Hand out a copy so callers can't change the cached counts
+        return Counter(self._rarity_counts)
+    
     def get_collection_by_rarity(self) -> Dict[str, List[CaughtPokemon]]:
         """Group Pokemon collection by rarity"""
         by_rarity = {"Common": [], "Uncommon": [], "Rare": [], "Legendary": []}
@@ -74,6 +74,9 @@ class PokemonData:
 class CaughtPokemon:
     """Represents a Pokemon in a player's collection"""
     
+    # Collections can hold thousands of these; slots keep each instance small
+    __slots__ = ('pokemon_data', 'collection_id', 'caught_date', 'caught_with', 'caught_from')
+    
     def __init__(self, pokemon_data: PokemonData, collection_id: int, 
                  caught_date: str, caught_with: str, caught_from: str = "encounter"):
         self.pokemon_data = pokemon_data
@@ -3,8 +3,9 @@ Pokémon Embed Utilities
 Helper functions for creating Pokemon-related Discord embeds.
 """
 
+from collections import OrderedDict
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 import discord
 
@@ -15,6 +16,10 @@ from ..models.pokemon_model import PokemonData, CaughtPokemon, PokemonStats
 class PokemonEmbedUtils:
     """Utilities for creating Pokemon-related Discord embeds"""
     
+    # Caught Pokémon detail embed payloads, keyed by the values that define them
+    DETAIL_EMBED_CACHE_SIZE = 8192
+    _detail_embed_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+    
     @staticmethod
     def create_wild_spawn_embed(pokemon: PokemonData) -> discord.Embed:
         """Create embed for wild Pokémon spawn"""
@@ -133,15 +138,22 @@ class PokemonEmbedUtils:
     @staticmethod
     def create_collection_embed(player_name: str, pokemon_collection: List[CaughtPokemon], is_own_collection: bool = True, user_mention: str = None) -> discord.Embed:
         """Create embed for Pokemon collection display"""
+        return PokemonEmbedUtils.create_collection_embed_from_dicts(
+            player_name, [pokemon.to_dict() for pokemon in pokemon_collection], is_own_collection, user_mention
+        )
+
+    @staticmethod
+    def create_collection_embed_from_dicts(player_name: str, pokemon_documents: List[Dict[str, Any]], is_own_collection: bool = True, user_mention: str = None) -> discord.Embed:
+        """Create embed for Pokemon collection display straight from stored Pokemon documents"""
         title = f"📖 {player_name}'s Collection" if is_own_collection else f"📖 {player_name}'s Collection"
         
         embed = discord.Embed(
             title=title,
-            description=f"**Total Pokemon:** {len(pokemon_collection)}",
+            description=f"**Total Pokemon:** {len(pokemon_documents)}",
             color=discord.Color.blue()
         )
         
-        if not pokemon_collection:
+        if not pokemon_documents:
             if is_own_collection:
                 embed.description = "You haven't caught any Pokemon yet!\nUse `!encounter` to find wild Pokemon."
             else:
@@ -150,8 +162,8 @@ class PokemonEmbedUtils:
         
         # Group Pokemon by rarity
         by_rarity = {"Common": [], "Uncommon": [], "Rare": [], "Legendary": []}
-        for pokemon in pokemon_collection:
-            rarity = pokemon.rarity
+        for pokemon in pokemon_documents:
+            rarity = pokemon['rarity']
             if rarity in by_rarity:
                 by_rarity[rarity].append(pokemon)
         
@@ -160,8 +172,9 @@ class PokemonEmbedUtils:
             if by_rarity[rarity]:
                 pokemon_names = []
                 for p in by_rarity[rarity]:
-                    type_text = PokemonTypeUtils.format_types(p.types)
-                    pokemon_names.append(f"**#{p.collection_id} {p.name}** ({type_text})")
+                    types = p['types'] if isinstance(p['types'], list) else [p['types']]
+                    type_text = PokemonTypeUtils.format_types(types)
+                    pokemon_names.append(f"**#{p['id']} {p['name']}** ({type_text})")
                 
                 display_names = pokemon_names[:6]  # Show fewer Pokemon for cleaner display
                 if len(pokemon_names) > 6:
@@ -175,13 +188,13 @@ class PokemonEmbedUtils:
                 )
         
         # Simple collection stats
-        wild_caught = len([p for p in pokemon_collection if p.caught_from == 'wild_spawn'])
-        encounter_caught = len([p for p in pokemon_collection if p.caught_from != 'wild_spawn'])
+        wild_caught = len([p for p in pokemon_documents if p.get('caught_from') == 'wild_spawn'])
+        encounter_caught = len(pokemon_documents) - wild_caught
         
         # Generation breakdown
         gen_count = {}
-        for p in pokemon_collection:
-            gen = p.generation
+        for p in pokemon_documents:
+            gen = p.get('generation')
             gen_count[gen] = gen_count.get(gen, 0) + 1
         
         stats_text = f"**Wild Catches:** {wild_caught} | **Encounters:** {encounter_caught}"
@@ -201,14 +214,14 @@ class PokemonEmbedUtils:
             embed.add_field(name="👤 Collection Owner", value=user_mention, inline=True)
         
         # Add simple image display
-        if pokemon_collection:
+        if pokemon_documents:
             # Find the most recent Pokemon
-            display_pokemon = max(pokemon_collection, key=lambda x: x.caught_date)
+            display_pokemon = max(pokemon_documents, key=lambda x: x['caught_date'])
             
             # Set the image
-            embed.set_image(url=display_pokemon.image_url)
+            embed.set_image(url=display_pokemon['image_url'])
             # Static footer
-            embed.set_footer(text=f"Showing {display_pokemon.name} • Legion Pokemon System")
+            embed.set_footer(text=f"Showing {display_pokemon['name']} • Legion Pokemon System")
         
         return embed
 
@@ -258,8 +271,25 @@ class PokemonEmbedUtils:
 
     @staticmethod
     def create_cached_pokemon_detail_embed(pokemon: CaughtPokemon, user_mention: str = None) -> discord.Embed:
-        embed = PokemonEmbedUtils._pokemon_detail_top(pokemon.name, pokemon.description, pokemon.types, pokemon.image_url, pokemon.sprite_url, pokemon.collection_id, pokemon.rarity)
-        # Caught date
-        caught_date = datetime.fromisoformat(pokemon.caught_date).strftime("%B %d, %Y at %I:%M %p")
-        embed.add_field(name="📅 Caught On", value=caught_date, inline=True)
-        return PokemonEmbedUtils._pokemon_detail_bottom(embed, pokemon.generation, pokemon.stats, user_mention)
\ No newline at end of file
+        # Caught Pokémon never change, so the payload is rebuilt only for new ones.
+        # caught_date tells apart Pokémon that reuse a collection ID after a reset
+        cache = PokemonEmbedUtils._detail_embed_cache
+        key = (pokemon.collection_id, pokemon.name, pokemon.caught_date, user_mention)
+        data = cache.get(key)
+        if data is not None:
+            cache.move_to_end(key)
+        else:
+            embed = PokemonEmbedUtils._pokemon_detail_top(pokemon.name, pokemon.description, pokemon.types, pokemon.image_url, pokemon.sprite_url, pokemon.collection_id, pokemon.rarity)
+            # Caught date
+            caught_date = datetime.fromisoformat(pokemon.caught_date).strftime("%B %d, %Y at %I:%M %p")
+            embed.add_field(name="📅 Caught On", value=caught_date, inline=True)
+            data = PokemonEmbedUtils._pokemon_detail_bottom(embed, pokemon.generation, pokemon.stats, user_mention).to_dict()
+            cache[key] = data
+            if len(cache) > PokemonEmbedUtils.DETAIL_EMBED_CACHE_SIZE:
+                cache.popitem(last=False)
+        
+        # from_dict shares the payload's containers; copy the fields and the thumbnail, image,
+        # footer and author dicts so callers can't alter the cache
+        payload = {key: dict(value) if isinstance(value, dict) else value for key, value in data.items()}
+        payload["fields"] = [dict(field) for field in data.get("fields", ())]
+        return discord.Embed.from_dict(payload)
\ No newline at end of file
@@ -2,7 +2,13 @@
 
 import discord
 from discord.ext import commands
-from typing import Union, Any
+from typing import Union, Any, Dict, Hashable, Tuple
+
+# Most replies send_or_edit remembers per cache before forgetting the oldest
+MAX_TRACKED_REPLIES = 1024
+
+# Most repeated commands send_or_edit answers with one reply before sending a fresh one
+MAX_REUSED_REPLY_COMMANDS = 10
 
 class UnifiedContext:
     """A wrapper that unifies discord.ext.commands.Context and discord.Interaction"""
@@ -46,11 +52,47 @@ class UnifiedContext:
                 await self._original.followup.send(content=content, embed=embed, ephemeral=ephemeral, **kwargs)
         else:
             # For regular commands, use ctx.send (ignore ephemeral for prefix commands)
-            await self._original.send(content=content, embed=embed, **kwargs)
+            return await self._original.send(content=content, embed=embed, **kwargs)
     
     async def send_error(self, embed, ephemeral=True):
         """Send an error message (ephemeral for slash commands, normal for prefix)"""
         await self.send(embed=embed, ephemeral=ephemeral if self._is_interaction else False)
+    
+    async def send_or_edit(self, embed, reply_cache: Dict[Hashable, Tuple[discord.Message, Dict[str, Any], Tuple[int, ...]]], cache_key: Hashable):
+        """
+        Send an embed, or skip it if the previous reply for cache_key is identical and still sits right above the command.
+        A changed embed is always sent; only an identical one costs a channel history request to check
+        """
+        if self._is_interaction:
+            # Slash commands must always respond
+            await self.send(embed=embed)
+            return
+        
+        payload = embed.to_dict()
+        command_message = self._original.message
+        previous = reply_cache.get(cache_key)
+        if previous is not None:
+            previous_reply, previous_payload, message_ids = previous
+            # The reply is still on screen if it and the commands that reused it are the latest messages.
+            # A deleted reply breaks the match, so a fresh one is sent
+            if (payload == previous_payload and len(message_ids) < MAX_REUSED_REPLY_COMMANDS
+                    and await self._previous_message_ids(command_message, len(message_ids)) == message_ids[::-1]):
+                reply_cache[cache_key] = (previous_reply, payload, message_ids + (command_message.id,))
+                return
+        
+        reply = await self.send(embed=embed)
+        reply_cache.pop(cache_key, None)
+        reply_cache[cache_key] = (reply, payload, (reply.id,))
+        if len(reply_cache) > MAX_TRACKED_REPLIES:
+            reply_cache.pop(next(iter(reply_cache)))
+    
+    @staticmethod
+    async def _previous_message_ids(message: discord.Message, limit: int) -> Tuple[int, ...]:
+        """Fetch the IDs of the messages sent right before message in its channel, newest first (empty if unreadable)"""
+        try:
+            return tuple([previous.id async for previous in message.channel.history(limit=limit, before=message)])
+        except discord.HTTPException:
+            return ()
 
 def create_unified_context(ctx_or_interaction):
     """Create a unified context from either a Context or Interaction"""
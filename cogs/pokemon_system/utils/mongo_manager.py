@@ -3,18 +3,51 @@ MongoDB Manager
 Handles connection and operations with MongoDB for Pokémon data.
 """
 
+import asyncio
 import os
-from typing import Dict, List, Any, Optional
-from pymongo import MongoClient
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Any, Optional, Tuple, TypeVar
+from pymongo import MongoClient, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 from dotenv import load_dotenv
 from bson.objectid import ObjectId
 
+from config import Config
+
 # Load environment variables
 load_dotenv()
 
+# Marks a read-cache miss, since None is a valid cached party
+_CACHE_MISS = object()
+
+_T = TypeVar("_T")
+
 class MongoManager:
     """Manages MongoDB connection and operations for Pokémon data"""
     
+    # Most queued Pokémon written by one insert_many
+    BATCH_MAX_SIZE = 500
+    
+    # Per-owner Pokémon list and party reads are reused for this many seconds,
+    # for at most this many owners, unless a write for the owner invalidates them
+    OWNER_CACHE_TTL = 15
+    OWNER_CACHE_MAX_USERS = 4096
+    
+    # Most queries run_in_thread lets run at once, so bursts can't exhaust the default thread pool
+    MAX_CONCURRENT_QUERIES = 32
+    
+    # Party document field holding each slot (1-6)
+    PARTY_SLOT_FIELDS = {
+        1: "first_pokemon",
+        2: "second_pokemon",
+        3: "third_pokemon",
+        4: "fourth_pokemon",
+        5: "fifth_pokemon",
+        6: "sixth_pokemon"
+    }
+    
     def __init__(self):
         # Get MongoDB connection details from environment variables
         mongo_uri = os.getenv("MONGO_URI", "mongodb://localhost:27017")
@@ -25,16 +58,136 @@ class MongoManager:
         self.db = self.client[db_name]
         self.caught_pokemon = self.db["caught_pokemon"]
         self.pokemon_parties = self.db["pokemon_parties"]
+        self.counters = self.db["counters"]
+        
+        # Pending batched inserts and the task flushing them
+        self._pending_pokemon: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._pokemon_flush_task: Optional[asyncio.Task] = None
+        
+        # Owner Pokémon reads waiting for the next coalesced query: projection key -> {owner_id: future}
+        self._pending_owner_reads: Dict[Hashable, Dict[str, asyncio.Future]] = {}
+        
+        # owner_id -> {read key: (expires_at, result)}, least recently used owner first
+        self._owner_pokemon_cache: "OrderedDict[str, Dict[Hashable, Tuple[float, Any]]]" = OrderedDict()
+        self._party_cache: "OrderedDict[str, Dict[Hashable, Tuple[float, Any]]]" = OrderedDict()
+        
+        # Queries run from worker threads, so cache access is locked. The generation
+        # advances on every invalidation; a read that started before one isn't cached
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+        
+        self._query_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_QUERIES)
+        
+        self.logger = Config.setup_logging()
         
         # Create indexes for better query performance
         self._create_indexes()
+        self._log_index_sizes()
         
     def _create_indexes(self):
-        """Create necessary indexes for better query performance"""
-        # Index for owner_id for faster lookups
-        self.caught_pokemon.create_index("owner_id")
-        self.pokemon_parties.create_index("owner_id")
+        """Create the indexes backing every hot query predicate"""
+        # owner_id on parties: one party per user. Earlier versions created this
+        # index without the unique flag, so replace it; if duplicate parties
+        # already exist, keep a plain index so startup doesn't fail
+        party_owner_index = self.pokemon_parties.index_information().get("owner_id_1")
+        if party_owner_index is None or not party_owner_index.get("unique"):
+            if party_owner_index is not None:
+                self.pokemon_parties.drop_index("owner_id_1")
+            try:
+                self.pokemon_parties.create_index("owner_id", unique=True)
+            except OperationFailure:
+                self.logger.error(
+                    "Duplicate parties found; owner_id is not unique on pokemon_parties. "
+                    "Remove the duplicate party documents and restart to enforce one party per user"
+                )
+                self.pokemon_parties.create_index("owner_id")
+        
+        # Owner-only Pokémon queries (listing, counts, leaderboards) use the
+        # owner_id prefix of the compound indexes below, so a standalone
+        # caught_pokemon owner_id index would only slow writes
+        try:
+            self.caught_pokemon.drop_index("owner_id_1")
+        except OperationFailure:
+            pass
+        
+        # (owner_id, name): owned-name counts and name lookups
+        self.caught_pokemon.create_index([("owner_id", 1), ("name", 1)])
+        
+        # (owner_id, id): ID lookups and highest-ID scans in either direction.
+        # Per-owner Pokémon IDs must be unique; fall back to a plain index if
+        # existing data already contains duplicates so startup doesn't fail
+        try:
+            self.caught_pokemon.create_index([("owner_id", 1), ("id", 1)], unique=True)
+        except OperationFailure:
+            self.logger.warning("Duplicate Pokémon IDs found; creating non-unique (owner_id, id) index")
+            self.caught_pokemon.create_index([("owner_id", 1), ("id", 1)])
+    
+    def _log_index_sizes(self):
+        """Log index sizes so growth beyond available RAM is visible"""
+        try:
+            index_sizes = self.db.command("collStats", "caught_pokemon").get("indexSizes", {})
+        except Exception as e:
+            self.logger.warning(f"Could not read caught_pokemon index sizes: {e}")
+            return
+        
+        sizes_text = ", ".join(f"{name}={size / 1024:.1f} KiB" for name, size in index_sizes.items())
+        self.logger.info(f"caught_pokemon index sizes: {sizes_text}")
+        
+    async def run_in_thread(self, method: Callable[..., _T], *args, **kwargs) -> _T:
+        """
+        Run a blocking MongoManager method in a worker thread so the event loop stays free
         
+        Args:
+            method: Bound MongoManager method to call
+            *args, **kwargs: Arguments passed to the method
+            
+        Returns:
+            The method's result
+        """
+        async with self._query_semaphore:
+            return await asyncio.to_thread(method, *args, **kwargs)
+    
+    def _cache_get(self, cache: OrderedDict, owner_id: str, key: Hashable) -> Tuple[Any, int]:
+        """Get an unexpired cached read for an owner (or _CACHE_MISS) and the current generation"""
+        with self._cache_lock:
+            generation = self._cache_generation
+            entries = cache.get(owner_id)
+            if entries is None:
+                return _CACHE_MISS, generation
+            entry = entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                return _CACHE_MISS, generation
+            cache.move_to_end(owner_id)
+            return entry[1], generation
+    
+    def _cache_put(self, cache: OrderedDict, owner_id: str, key: Hashable, value: Any, generation: int):
+        """Remember a read for an owner unless it may predate an invalidation"""
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
+            cache.setdefault(owner_id, {})[key] = (time.monotonic() + self.OWNER_CACHE_TTL, value)
+            cache.move_to_end(owner_id)
+            if len(cache) > self.OWNER_CACHE_MAX_USERS:
+                cache.popitem(last=False)
+    
+    @property
+    def cache_generation(self) -> int:
+        """Counter that advances whenever Pokémon or party data is written"""
+        with self._cache_lock:
+            return self._cache_generation
+    
+    def invalidate_owner_cache(self, owner_id: str):
+        """
+        Drop cached Pokémon list and party reads for a user
+        
+        Args:
+            owner_id: Discord user ID of the owner
+        """
+        with self._cache_lock:
+            self._owner_pokemon_cache.pop(owner_id, None)
+            self._party_cache.pop(owner_id, None)
+            self._cache_generation += 1
+    
     def add_pokemon(self, pokemon_data: Dict[str, Any]) -> str:
         """
         Add a Pokémon to the database
@@ -49,13 +202,67 @@ class MongoManager:
             raise ValueError("Pokemon data must include owner_id")
             
         result = self.caught_pokemon.insert_one(pokemon_data)
+        self.invalidate_owner_cache(pokemon_data["owner_id"])
         return str(result.inserted_id)
+    
+    def enqueue_pokemon(self, pokemon_data: Dict[str, Any]) -> asyncio.Future:
+        """
+        Queue a Pokémon to be added with the next batched insert
+        
+        Args:
+            pokemon_data: Dictionary containing Pokémon data with owner_id
+            
+        Returns:
+            Future resolving to the ID of the inserted document once it is written
+        """
+        if "owner_id" not in pokemon_data:
+            raise ValueError("Pokemon data must include owner_id")
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_pokemon.append((pokemon_data, future))
+        
+        if self._pokemon_flush_task is None or self._pokemon_flush_task.done():
+            self._pokemon_flush_task = loop.create_task(self._flush_pending_pokemon())
+        return future
+    
+    async def _flush_pending_pokemon(self):
+        """
+        Write queued Pokémon with insert_many until the queue is drained.
+        Pokémon queued while a write is running go out together in the next one.
+        """
+        while self._pending_pokemon:
+            batch = self._pending_pokemon[:self.BATCH_MAX_SIZE]
+            del self._pending_pokemon[:self.BATCH_MAX_SIZE]
+            documents = [document for document, _ in batch]
+            
+            failed = {}
+            try:
+                await asyncio.to_thread(self.caught_pokemon.insert_many, documents, ordered=False)
+            except BulkWriteError as e:
+                for write_error in e.details.get("writeErrors", []):
+                    failed[write_error["index"]] = BulkWriteError(write_error)
+            except Exception as e:
+                failed = {index: e for index in range(len(batch))}
+            
+            for document in documents:
+                self.invalidate_owner_cache(document["owner_id"])
+            
+            # insert_many assigns _id on each document in place
+            for index, (document, future) in enumerate(batch):
+                if future.done():
+                    continue
+                if index in failed:
+                    future.set_exception(failed[index])
+                else:
+                    future.set_result(str(document["_id"]))
 
     def get_pokemon_by_owner(
             self,
             owner_id: str,
             page: Optional[int] = None,
-            max_per_page: Optional[int] = None
+            max_per_page: Optional[int] = None,
+            projection: Optional[Dict[str, int]] = None
     ) -> List[Dict[str, Any]]:
         """
         Get all Pokémon owned by a specific user, optionally paginated.
@@ -64,17 +271,167 @@ class MongoManager:
             owner_id: Discord user ID of the owner
             page: Page number (1-based), optional
             max_per_page: Maximum items per page, optional
+            projection: Fields to return, optional (all fields if omitted)
 
         Returns:
             List of Pokémon documents
         """
 
-        query = {"owner_id": owner_id}
-        cursor = self.caught_pokemon.find(query)
-        if page is not None and max_per_page is not None:
-            skip = (page - 1) * max_per_page
-            cursor = cursor.skip(skip).limit(max_per_page)
-        return list(cursor)
+        cache_key = (page, max_per_page, tuple(sorted(projection.items())) if projection else None)
+        documents, generation = self._cache_get(self._owner_pokemon_cache, owner_id, cache_key)
+        if documents is _CACHE_MISS:
+            query = {"owner_id": owner_id}
+            cursor = self.caught_pokemon.find(query, projection)
+            if page is not None and max_per_page is not None:
+                skip = (page - 1) * max_per_page
+                cursor = cursor.skip(skip).limit(max_per_page)
+            documents = list(cursor)
+            self._cache_put(self._owner_pokemon_cache, owner_id, cache_key, documents, generation)
+        # Hand out a fresh list so callers can't reorder or trim the cached one
+        return list(documents)
+        
+    async def get_pokemon_by_owner_async(
+            self,
+            owner_id: str,
+            projection: Optional[Dict[str, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all Pokémon owned by a user, sharing one query with other owners
+        requested in the same event loop iteration
+
+        Args:
+            owner_id: Discord user ID of the owner
+            projection: Fields to return, optional (all fields if omitted)
+
+        Returns:
+            List of Pokémon documents
+        """
+        projection_key = tuple(sorted(projection.items())) if projection else None
+        documents, _ = self._cache_get(self._owner_pokemon_cache, owner_id, (None, None, projection_key))
+        if documents is _CACHE_MISS:
+            # Other commands share this read, so cancelling one must not cancel it for the rest
+            documents = await asyncio.shield(self._queue_owner_read(owner_id, projection_key))
+        return list(documents)
+    
+    def _queue_owner_read(self, owner_id: str, projection_key: Hashable) -> asyncio.Future:
+        """Join (or start) the pending read for an owner and schedule the batch flush"""
+        loop = asyncio.get_running_loop()
+        if not self._pending_owner_reads:
+            loop.call_soon(self._flush_owner_reads)
+        
+        owner_futures = self._pending_owner_reads.setdefault(projection_key, {})
+        future = owner_futures.get(owner_id)
+        if future is None:
+            future = owner_futures[owner_id] = loop.create_future()
+        return future
+    
+    def _flush_owner_reads(self):
+        """Start one query per projection for every owner read queued this iteration"""
+        pending, self._pending_owner_reads = self._pending_owner_reads, {}
+        for projection_key, owner_futures in pending.items():
+            asyncio.create_task(self._read_owner_batch(projection_key, owner_futures))
+    
+    async def _read_owner_batch(self, projection_key: Hashable, owner_futures: Dict[str, asyncio.Future]):
+        """Fetch Pokémon for several owners with one $in query and resolve each owner's future"""
+        projection = dict(projection_key) if projection_key else None
+        # Grouping needs owner_id even when the caller's projection leaves it out
+        strip_owner = projection is not None and not projection.get("owner_id")
+        if strip_owner:
+            projection["owner_id"] = 1
+        
+        with self._cache_lock:
+            generation = self._cache_generation
+        query = {"owner_id": {"$in": list(owner_futures)}}
+        try:
+            documents = await self.run_in_thread(lambda: list(self.caught_pokemon.find(query, projection)))
+        except Exception as e:
+            for future in owner_futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        by_owner: Dict[str, List[Dict[str, Any]]] = {owner_id: [] for owner_id in owner_futures}
+        for document in documents:
+            owner_id = document.pop("owner_id") if strip_owner else document["owner_id"]
+            by_owner[owner_id].append(document)
+        
+        for owner_id, future in owner_futures.items():
+            owner_documents = by_owner[owner_id]
+            self._cache_put(self._owner_pokemon_cache, owner_id, (None, None, projection_key), owner_documents, generation)
+            if not future.done():
+                future.set_result(owner_documents)
+        
+    def get_pokemon_page_with_count(
+            self,
+            owner_id: str,
+            page: int,
+            max_per_page: int,
+            projection: Optional[Dict[str, int]] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get one page of a user's Pokémon, ordered by ID, together with how many they own
+        
+        Args:
+            owner_id: Discord user ID of the owner
+            page: Page number (1-based)
+            max_per_page: Maximum items per page
+            projection: Fields to return, optional (all fields if omitted)
+            
+        Returns:
+            Tuple of (Pokémon documents on the page, total number of Pokémon owned)
+        """
+        page_stages = [{"$skip": max(page - 1, 0) * max_per_page}, {"$limit": max_per_page}]
+        if projection:
+            page_stages.append({"$project": projection})
+        pipeline = [
+            {"$match": {"owner_id": owner_id}},
+            {"$sort": {"id": 1}},
+            {"$facet": {"page": page_stages, "total": [{"$count": "n"}]}}
+        ]
+        result = next(self.caught_pokemon.aggregate(pipeline), None)
+        if not result:
+            return [], 0
+        total = result["total"][0]["n"] if result["total"] else 0
+        return result["page"], total
+    
+    def get_pokemon_by_owner_and_ids(
+            self,
+            owner_id: str,
+            pokemon_ids: List[int],
+            projection: Optional[Dict[str, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the Pokémon a user owns among the given collection IDs
+        
+        Args:
+            owner_id: Discord user ID of the owner
+            pokemon_ids: Collection IDs to look up
+            projection: Fields to return, optional (all fields if omitted)
+            
+        Returns:
+            List of matching Pokémon documents (IDs the user doesn't own are skipped)
+        """
+        return list(self.caught_pokemon.find({"owner_id": owner_id, "id": {"$in": list(pokemon_ids)}}, projection))
+    
+    def get_pokemon_by_owner_and_identifier(self, owner_id: str, identifier: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a single Pokémon owned by a user by "#<collection id>" or exact name
+        
+        Args:
+            owner_id: Discord user ID of the owner
+            identifier: "#" followed by the collection ID, or the Pokémon's stored name
+            
+        Returns:
+            The lowest-numbered matching Pokémon document or None if not found
+        """
+        if identifier.startswith('#'):
+            collection_id = identifier[1:]
+            if not collection_id.isdigit():
+                return None
+            query = {"owner_id": owner_id, "id": int(collection_id)}
+        else:
+            query = {"owner_id": owner_id, "name": identifier}
+        return self.caught_pokemon.find_one(query, sort=[("id", 1)])
         
     def get_pokemon_by_id(self, pokemon_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -102,10 +459,16 @@ class MongoManager:
             True if deletion was successful, False otherwise
         """
         try:
-            result = self.caught_pokemon.delete_one({"_id": ObjectId(pokemon_id)})
-            return result.deleted_count > 0
+            deleted = self.caught_pokemon.find_one_and_delete(
+                {"_id": ObjectId(pokemon_id)},
+                projection={"owner_id": 1}
+            )
         except Exception:
             return False
+        if deleted is None:
+            return False
+        self.invalidate_owner_cache(deleted["owner_id"])
+        return True
             
     def delete_all_pokemon_by_owner(self, owner_id: str) -> int:
         """
@@ -118,6 +481,8 @@ class MongoManager:
             Number of deleted documents
         """
         result = self.caught_pokemon.delete_many({"owner_id": owner_id})
+        self.counters.delete_one({"_id": owner_id})
+        self.invalidate_owner_cache(owner_id)
         return result.deleted_count
         
     def count_pokemon_by_owner(self, owner_id: str) -> int:
@@ -130,7 +495,8 @@ class MongoManager:
         Returns:
             Number of Pokémon owned by the user
         """
-        return self.caught_pokemon.count_documents({"owner_id": owner_id})
+        # Count from the (owner_id, id) index keys rather than the documents
+        return self.caught_pokemon.count_documents({"owner_id": owner_id}, hint=[("owner_id", 1), ("id", 1)])
     
     def has_pokemon_by_name(self, owner_id: str, pokemon_name: str) -> bool:
         """
@@ -149,10 +515,62 @@ class MongoManager:
         })
         return count > 0
 
-    def get_pokemon_grouped_by_owner(self) -> List[Dict[str, Any]]:
+    def get_pokemon_name_counts(self, owner_id: str) -> Dict[str, int]:
+        """
+        Count how many of each Pokémon a specific user owns
+        
+        Args:
+            owner_id: Discord user ID of the owner
+            
+        Returns:
+            Dictionary mapping Pokémon name to owned count
+        """
+        pipeline = [
+            {"$match": {"owner_id": owner_id}},
+            {"$group": {"_id": "$name", "count": {"$sum": 1}}}
+        ]
+        return {entry["_id"]: entry["count"] for entry in self.caught_pokemon.aggregate(pipeline)}
+
+    def get_duplicate_name_page(self, owner_id: str, skip: int, limit: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Get one page of the Pokémon a user owns more than once, most duplicated first,
+        together with how many different Pokémon are duplicated, in a single aggregation
+        
+        Args:
+            owner_id: Discord user ID of the owner
+            skip: Number of entries to skip
+            limit: Maximum number of entries to return
+            
+        Returns:
+            Tuple of (number of duplicated names, list of {"_id": name, "count": owned count} documents)
+        """
+        pipeline = [
+            {"$match": {"owner_id": owner_id}},
+            {"$group": {"_id": "$name", "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}},
+            {"$facet": {
+                "total": [{"$count": "n"}],
+                "page": [
+                    {"$sort": {"count": -1, "_id": 1}},
+                    {"$skip": skip},
+                    {"$limit": limit}
+                ]
+            }}
+        ]
+        result = next(self.caught_pokemon.aggregate(pipeline), None)
+        if not result:
+            return 0, []
+        total = result["total"][0]["n"] if result["total"] else 0
+        return total, result["page"]
+
+    def get_pokemon_grouped_by_owner(self, projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
         """
         Fetch all Pokémon entries grouped by owner_id.
 
+        Args:
+            projection: Fields to keep on each Pokémon, optional (all fields if omitted).
+                Must keep owner_id, which the grouping reads
+
         Returns:
             List of dicts with owner_id and their Pokémon list.
         """
@@ -164,6 +582,8 @@ class MongoManager:
                 }
             }
         ]
+        if projection:
+            pipeline.insert(0, {"$project": projection})
         return list(self.caught_pokemon.aggregate(pipeline))
 
     def get_last_pokemon(self, owner_id) -> Optional[Dict[str, Any]]:
@@ -180,6 +600,51 @@ class MongoManager:
             sort=[("id", -1)]
         )
     
+    def get_last_pokemon_id(self, owner_id: str) -> int:
+        """
+        Get the highest Pokémon ID a specific user has, reading only the ID field.
+        
+        Args:
+            owner_id: Discord user ID of the owner
+            
+        Returns:
+            The highest Pokémon ID, or 0 if the user has none
+        """
+        last_pokemon = self.caught_pokemon.find_one(
+            {"owner_id": owner_id},
+            projection={"id": 1, "_id": 0},
+            sort=[("id", -1)]
+        )
+        return last_pokemon.get("id", 0) if last_pokemon else 0
+    
+    def next_pokemon_id(self, owner_id: str) -> int:
+        """
+        Atomically allocate the next Pokémon ID for a specific user.
+        
+        Args:
+            owner_id: Discord user ID of the owner
+            
+        Returns:
+            The newly allocated Pokémon ID
+        """
+        counter = self.counters.find_one_and_update(
+            {"_id": owner_id},
+            {"$inc": {"seq": 1}},
+            projection={"seq": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        if counter is None:
+            # First allocation for this user: seed the counter from existing catches
+            last_id = self.get_last_pokemon_id(owner_id)
+            self.counters.update_one({"_id": owner_id}, {"$max": {"seq": last_id}}, upsert=True)
+            counter = self.counters.find_one_and_update(
+                {"_id": owner_id},
+                {"$inc": {"seq": 1}},
+                projection={"seq": 1},
+                return_document=ReturnDocument.AFTER
+            )
+        return counter["seq"]
+    
     # ========== PARTY MANAGEMENT METHODS ==========
     
     def get_party(self, owner_id: str) -> Optional[Dict[str, Any]]:
@@ -192,7 +657,12 @@ class MongoManager:
         Returns:
             Party document or None if not found
         """
-        return self.pokemon_parties.find_one({"owner_id": owner_id})
+        party, generation = self._cache_get(self._party_cache, owner_id, None)
+        if party is _CACHE_MISS:
+            party = self.pokemon_parties.find_one({"owner_id": owner_id})
+            self._cache_put(self._party_cache, owner_id, None, party, generation)
+        # Callers fill in slots on the returned document, so never hand out the cached one
+        return dict(party) if party is not None else None
     
     def create_or_update_party(self, owner_id: str, party_data: Dict[str, Any]) -> str:
         """
@@ -216,11 +686,36 @@ class MongoManager:
                 {"owner_id": owner_id},
                 {"$set": party_data}
             )
-            return str(existing_party["_id"])
+            party_id = str(existing_party["_id"])
         else:
             # Create new party
             result = self.pokemon_parties.insert_one(party_data)
-            return str(result.inserted_id)
+            party_id = str(result.inserted_id)
+        
+        # Invalidate after writing, since the lookup above re-caches the old party
+        self.invalidate_owner_cache(owner_id)
+        return party_id
+    
+    def clear_party_slots(self, owner_id: str, slot_fields: List[str]) -> bool:
+        """
+        Empty specific slots of a user's party with a single partial update
+        
+        Args:
+            owner_id: Discord user ID of the owner
+            slot_fields: Party document fields to clear
+            
+        Returns:
+            True if a party was updated, False otherwise
+        """
+        if not slot_fields:
+            return False
+        
+        result = self.pokemon_parties.update_one(
+            {"owner_id": owner_id},
+            {"$set": dict.fromkeys(slot_fields)}
+        )
+        self.invalidate_owner_cache(owner_id)
+        return result.matched_count > 0
     
     def add_pokemon_to_party(self, owner_id: str, index: int, pokemon_id: int) -> bool:
         """
@@ -232,40 +727,38 @@ class MongoManager:
             pokemon_id: ID of the Pokémon to add
             
         Returns:
-            True if successful, False otherwise
+            True if successful, False if the index is invalid or the Pokémon
+            is already in another slot
         """
         if not (1 <= index <= 6):
             return False
         
-        # Get existing party or create default
-        party = self.get_party(owner_id)
-        if not party:
-            party = {
-                "owner_id": owner_id,
-                "first_pokemon": None,
-                "second_pokemon": None,
-                "third_pokemon": None,
-                "fourth_pokemon": None,
-                "fifth_pokemon": None,
-                "sixth_pokemon": None
-            }
-        
-        # Map index to field name
-        field_map = {
-            1: "first_pokemon",
-            2: "second_pokemon", 
-            3: "third_pokemon",
-            4: "fourth_pokemon",
-            5: "fifth_pokemon",
-            6: "sixth_pokemon"
-        }
-        
-        # Update the specific slot
-        party[field_map[index]] = pokemon_id
+        slot_field = self.PARTY_SLOT_FIELDS[index]
+        other_slots = [field for field in self.PARTY_SLOT_FIELDS.values() if field != slot_field]
         
-        # Save the party
-        self.create_or_update_party(owner_id, party)
-        return True
+        try:
+            # Set the slot in one write, guarded so a Pokémon can't end up in two slots
+            result = self.pokemon_parties.update_one(
+                {"owner_id": owner_id, **{field: {"$ne": pokemon_id} for field in other_slots}},
+                {"$set": {slot_field: pokemon_id}}
+            )
+            if result.matched_count:
+                return True
+            
+            # No match means either no party yet or the Pokémon is in another slot.
+            # Create a missing party holding just this slot; an existing one is left alone
+            try:
+                result = self.pokemon_parties.update_one(
+                    {"owner_id": owner_id},
+                    {"$setOnInsert": {**dict.fromkeys(other_slots), slot_field: pokemon_id}},
+                    upsert=True
+                )
+            except DuplicateKeyError:
+                # Another request created the party first
+                return False
+            return result.upserted_id is not None
+        finally:
+            self.invalidate_owner_cache(owner_id)
     
     def remove_pokemon_from_party(self, owner_id: str, index: int) -> bool:
         """
@@ -285,18 +778,8 @@ class MongoManager:
         if not party:
             return False
         
-        # Map index to field name
-        field_map = {
-            1: "first_pokemon",
-            2: "second_pokemon", 
-            3: "third_pokemon",
-            4: "fourth_pokemon",
-            5: "fifth_pokemon",
-            6: "sixth_pokemon"
-        }
-        
         # Remove the Pokémon from the specific slot
-        party[field_map[index]] = None
+        party[self.PARTY_SLOT_FIELDS[index]] = None
         
         # Save the party
         self.create_or_update_party(owner_id, party)
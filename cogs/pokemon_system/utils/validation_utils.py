@@ -13,8 +13,9 @@ from ..models.pokemon_model import PokemonData
 class ValidationUtils:
     """Utilities for validating Pokemon command inputs and states"""
     
-    # Valid ball types for catching Pokemon
-    VALID_BALL_TYPES = ["poke", "great", "ultra", "master", "normal", "pokeball", "great_ball", "ultra_ball", "master_ball"]
+    # Valid ball types for catching Pokemon, in display order
+    BALL_TYPE_OPTIONS = ("poke", "great", "ultra", "master", "normal", "pokeball", "great_ball", "ultra_ball", "master_ball")
+    VALID_BALL_TYPES = frozenset(BALL_TYPE_OPTIONS)
     
     @staticmethod
     def validate_ball_type(ball_type: str) -> Tuple[bool, Optional[str]]:
@@ -25,9 +26,8 @@ class ValidationUtils:
         if not ball_type:
             return False, "Ball type cannot be empty"
         
-        ball_type = ball_type.lower().strip()
-        if ball_type not in ValidationUtils.VALID_BALL_TYPES:
-            valid_types = ", ".join(ValidationUtils.VALID_BALL_TYPES)
+        if ball_type.lower().strip() not in ValidationUtils.VALID_BALL_TYPES:
+            valid_types = ", ".join(ValidationUtils.BALL_TYPE_OPTIONS)
             return False, f"Invalid ball type. Valid options: {valid_types}"
         
         return True, None